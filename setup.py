@@ -18,6 +18,9 @@ setup(
         'requests',
         'uvicorn[standard]>=0.22',
     ],
+    extras_require={
+        'speedups': ['orjson>=3.8'],
+    },
     entry_points={
         'console_scripts': ['ai-ticket=ai_ticket.cli:main'],
     },
@@ -1,5 +1,5 @@
 """Compatibility shims for optional async dependencies."""
 
-from . import anyio, httpx
+from . import anyio, httpx, orjson
 
-__all__ = ["anyio", "httpx"]
+__all__ = ["anyio", "httpx", "orjson"]
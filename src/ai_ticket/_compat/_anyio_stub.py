@@ -54,14 +54,17 @@ class TaskGroup(AbstractAsyncContextManager):
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
         errors: list[BaseException] = []
+        # Tasks may spawn siblings while we wait, so keep draining until empty.
+        # Gathered tasks stay in ``_tasks`` so ``cancel_scope`` can reach them.
         while self._tasks:
-            task = self._tasks.pop(0)
-            try:
-                await task
-            except asyncio.CancelledError:
-                continue
-            except Exception as error:  # pragma: no cover - defensive
-                errors.append(error)
+            tasks = self._tasks[:]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            del self._tasks[: len(tasks)]
+            errors.extend(
+                result
+                for result in results
+                if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError)
+            )
         if errors and exc is None:
             raise errors[0]
 
@@ -4,16 +4,27 @@ Like :mod:`ai_ticket._compat._anyio_stub`, this module is a pragmatic fallback
 that keeps tests operational when the real :mod:`httpx` package is not
 installable. Production deployments should still install the genuine library to
 benefit from streaming, HTTP/2, and other advanced features.
+
+When :mod:`aiohttp` is installed, :class:`AsyncClient` performs I/O on the
+event loop through it; otherwise each request runs :mod:`requests` in a worker
+thread.
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import requests
+
+from . import orjson
+
+try:  # pragma: no cover - optional dependency
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised when aiohttp is absent
+    aiohttp = None  # type: ignore[assignment]
 from werkzeug.test import Client as WerkzeugClient
 from werkzeug.wrappers import Response as WerkzeugResponse
 
@@ -57,6 +68,17 @@ class Request:
         self.url = url
 
 
+@lru_cache(maxsize=1024)
+def _request(method: str, url: str) -> Request:
+    """Return a shared :class:`Request` for ``method``/``url``.
+
+    Requests here only carry the method and URL for error reporting, so the
+    clients reuse one instance per endpoint instead of allocating per call.
+    """
+
+    return Request(method, url)
+
+
 class Response:
     def __init__(
         self,
@@ -69,8 +91,11 @@ class Response:
     ) -> None:
         self.status_code = status_code
         self.request = request
+        # A JSON body is kept decoded and only serialised if ``content`` or
+        # ``text`` is read; ``json()`` hands the original object back.
+        self._content: bytes | None
         if json is not None:
-            self._content = json_dumps(json)
+            self._content = None
             self._json_data = json
         elif text is not None:
             self._content = text.encode()
@@ -81,19 +106,21 @@ class Response:
 
     @property
     def content(self) -> bytes:
+        if self._content is None:
+            self._content = json_dumps(self._json_data)
         return self._content
 
     @property
     def text(self) -> str:
         try:
-            return self._content.decode()
+            return self.content.decode()
         except Exception:  # pragma: no cover - defensive
             return ""
 
     def json(self) -> Any:
         if self._json_data is not None:
             return self._json_data
-        return json.loads(self._content.decode())
+        return orjson.loads(self.content)
 
     def raise_for_status(self) -> None:
         if 400 <= self.status_code < 600:
@@ -102,7 +129,7 @@ class Response:
 
 
 def json_dumps(data: Any) -> bytes:
-    return json.dumps(data).encode()
+    return orjson.dumps(data)
 
 
 class WSGITransport:
@@ -137,16 +164,10 @@ class Client:
     ) -> Response:
         path = url if url.startswith("/") else f"/{url}"
         werkzeug_response = self._client.post(path, json=json, headers=headers or {})
-        try:
-            payload = werkzeug_response.get_json()
-        except Exception:  # pragma: no cover - depends on Flask internals
-            payload = None
-
-        request = Request("POST", f"{self._base_url}{path}")
+        request = _request("POST", f"{self._base_url}{path}")
         return Response(
             werkzeug_response.status_code,
             content=werkzeug_response.get_data(),
-            json=payload,
             request=request,
         )
 
@@ -155,11 +176,14 @@ class Client:
 
 
 class AsyncClient:
-    """Async client delegating requests to :mod:`requests` in a worker thread."""
+    """Async client using :mod:`aiohttp` when available, else :mod:`requests` in a worker thread."""
 
     def __init__(self, *, limits: Limits | None = None, timeout: float | None = None) -> None:
-        self._session = requests.Session()
+        self._limits = limits
         self._timeout = timeout
+        self._session: requests.Session | None = None
+        self._aiohttp_session: Any | None = None
+        self._aiohttp_loop: asyncio.AbstractEventLoop | None = None
 
     async def post(
         self,
@@ -170,36 +194,95 @@ class AsyncClient:
         timeout: float | None = None,
     ) -> Response:
         effective_timeout = timeout if timeout is not None else self._timeout
+        if aiohttp is not None:
+            return await self._post_with_aiohttp(url, headers=headers, json=json, timeout=effective_timeout)
+        return await self._post_with_requests(url, headers=headers, json=json, timeout=effective_timeout)
+
+    async def _post_with_aiohttp(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None,
+        json: Any | None,
+        timeout: float | None,
+    ) -> Response:
+        session = self._aiohttp_session
+        loop = asyncio.get_running_loop()
+        if session is None or session.closed or self._aiohttp_loop is not loop:
+            # Sessions bind to the loop they were created on; one left over
+            # from an earlier loop (e.g. a previous ``asyncio.run``) is unusable
+            # here, so it is retired and a new one created for this loop.
+            await self._retire_aiohttp_session()
+            max_connections = self._limits.max_connections if self._limits is not None else None
+            connector = aiohttp.TCPConnector(limit=max_connections or 100)
+            session = self._aiohttp_session = aiohttp.ClientSession(connector=connector)
+            self._aiohttp_loop = loop
+
+        request = _request("POST", url)
+        try:
+            async with session.post(
+                url,
+                headers=headers,
+                json=json,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                content = await response.read()
+                status_code = response.status
+        except asyncio.TimeoutError as exc:  # pragma: no cover - network env
+            raise ReadTimeout(str(exc), request=request) from exc
+        except aiohttp.ClientConnectionError as exc:  # pragma: no cover - network env
+            raise ConnectError(str(exc), request=request) from exc
+        except aiohttp.ClientError as exc:  # pragma: no cover - network env
+            raise RequestError(str(exc), request=request) from exc
+
+        return Response(status_code, content=content, request=request)
+
+    async def _retire_aiohttp_session(self) -> None:
+        session, loop = self._aiohttp_session, self._aiohttp_loop
+        self._aiohttp_session = self._aiohttp_loop = None
+        if session is None or session.closed or loop is None:
+            return
+        if loop is asyncio.get_running_loop() or loop.is_closed():
+            # A closed loop already tore down the transports, so this only
+            # marks the session and connector closed.
+            await session.close()
+        elif loop.is_running():  # pragma: no cover - loop owned by another thread
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+    async def _post_with_requests(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None,
+        json: Any | None,
+        timeout: float | None,
+    ) -> Response:
+        session = self._session
+        if session is None:
+            session = self._session = requests.Session()
 
         def _do_post() -> requests.Response:
-            return self._session.post(url, headers=headers, json=json, timeout=effective_timeout)
+            return session.post(url, headers=headers, json=json, timeout=timeout)
 
         try:
             response = await asyncio.to_thread(_do_post)
         except requests.exceptions.ConnectTimeout as exc:  # pragma: no cover - network env
-            raise ReadTimeout(str(exc), request=Request("POST", url)) from exc
+            raise ReadTimeout(str(exc), request=_request("POST", url)) from exc
         except requests.exceptions.ConnectionError as exc:  # pragma: no cover - network env
-            raise ConnectError(str(exc), request=Request("POST", url)) from exc
+            raise ConnectError(str(exc), request=_request("POST", url)) from exc
         except requests.exceptions.Timeout as exc:  # pragma: no cover - network env
-            raise ReadTimeout(str(exc), request=Request("POST", url)) from exc
+            raise ReadTimeout(str(exc), request=_request("POST", url)) from exc
         except requests.exceptions.RequestException as exc:
-            raise RequestError(str(exc), request=Request("POST", url)) from exc
+            raise RequestError(str(exc), request=_request("POST", url)) from exc
 
-        request = Request("POST", url)
-        try:
-            payload = response.json()
-        except ValueError:
-            payload = None
-        response_content = Response(
-            response.status_code,
-            content=response.content,
-            json=payload,
-            request=request,
-        )
-        return response_content
+        # The body is decoded only if the caller asks for ``json()``.
+        return Response(response.status_code, content=response.content, request=_request("POST", url))
 
     async def aclose(self) -> None:
-        await asyncio.to_thread(self._session.close)
+        await self._retire_aiohttp_session()
+        if self._session is not None:
+            await asyncio.to_thread(self._session.close)
+            self._session = None
 
 
 __all__ = [
@@ -0,0 +1,55 @@
+"""Subset of the orjson API implemented on top of the standard library.
+
+Mirrors :mod:`ai_ticket._compat._httpx_stub`: it keeps the server importable
+when :mod:`orjson` is not installed. Output is compact UTF-8 bytes, as with the
+real library, but encoding runs at stdlib speed.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable
+
+OPT_NON_STR_KEYS = 1 << 2
+OPT_SERIALIZE_DATACLASS = 0
+
+JSONDecodeError = json.JSONDecodeError
+
+
+class JSONEncodeError(TypeError):
+    """Raised when a value cannot be serialised."""
+
+
+def dumps(
+    obj: Any,
+    default: Callable[[Any], Any] | None = None,
+    option: int | None = None,
+) -> bytes:
+    def _default(value: Any) -> Any:
+        if is_dataclass(value) and not isinstance(value, type):
+            return asdict(value)
+        if default is not None:
+            return default(value)
+        raise JSONEncodeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+    try:
+        return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+    except ValueError as exc:  # pragma: no cover - circular references
+        raise JSONEncodeError(str(exc)) from exc
+
+
+def loads(obj: bytes | bytearray | memoryview | str) -> Any:
+    if isinstance(obj, memoryview):
+        obj = obj.tobytes()
+    return json.loads(obj)
+
+
+__all__ = [
+    "JSONDecodeError",
+    "JSONEncodeError",
+    "OPT_NON_STR_KEYS",
+    "OPT_SERIALIZE_DATACLASS",
+    "dumps",
+    "loads",
+]
@@ -68,6 +68,23 @@ class Request:
         self.method = scope.get("method", "GET").upper()
         self.url = URL(scope.get("path", "/"))
 
+    async def receive(self) -> dict[str, Any]:
+        """ASGI ``receive`` for downstream apps, replaying a body read here."""
+
+        if self._body is None:
+            return await self._receive()
+        return {"type": "http.request", "body": self._body, "more_body": False}
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        if self._body is not None:
+            yield self._body
+            return
+        more_body = True
+        while more_body:
+            message = await self._receive()
+            yield message.get("body", b"")
+            more_body = message.get("more_body", False)
+
     async def body(self) -> bytes:
         if self._body is None:
             chunks: list[bytes] = []
@@ -117,12 +134,15 @@ class Response:
 
 class JSONResponse(Response):
     def __init__(self, content: Any, *, status_code: int = 200, headers: dict[str, str] | None = None) -> None:
-        body = json.dumps(content).encode()
+        body = self.render(content)
         combined_headers = {"content-type": "application/json"}
         if headers:
             combined_headers.update({key.lower(): value for key, value in headers.items()})
         super().__init__(body, status_code=status_code, headers=combined_headers)
 
+    def render(self, content: Any) -> bytes:
+        return json.dumps(content, separators=(",", ":")).encode()
+
 
 class StreamingResponse(Response):
     def __init__(
@@ -155,11 +175,17 @@ class StreamingResponse(Response):
 
 
 class FileResponse(Response):
-    def __init__(self, path: Path | str, *, media_type: str | None = None) -> None:
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        headers: dict[str, str] | None = None,
+        media_type: str | None = None,
+    ) -> None:
         path = Path(path)
         content = path.read_bytes()
         guessed = media_type or _guess_media_type(path)
-        super().__init__(content, status_code=200, media_type=guessed)
+        super().__init__(content, status_code=200, headers=headers, media_type=guessed)
 
 
 def _guess_media_type(path: Path) -> str:
@@ -175,32 +201,115 @@ def _guess_media_type(path: Path) -> str:
 
 
 RequestResponseEndpoint = Callable[[Request], Awaitable[Response]]
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
 
 
-@dataclass
 class Middleware:
-    cls: type
-    options: dict[str, Any] | None = None
+    def __init__(self, cls: type, **options: Any) -> None:
+        self.cls = cls
+        self.options = options
+
+
+class _DownstreamResponse(Response):
+    """Relays a downstream app's messages as it sends them.
+
+    ``call_next`` runs the wrapped app in a task and returns once the response
+    has started, so streaming endpoints are not buffered behind middleware.
+    """
+
+    def __init__(self, app: ASGIApp, scope: dict[str, Any], receive: Receive) -> None:
+        super().__init__(b"")
+        self._messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=1)
+        self._task = asyncio.ensure_future(app(scope, receive, self._messages.put))
+
+    async def start(self) -> "_DownstreamResponse":
+        try:
+            message = await self._next_message()
+        except BaseException:
+            self._task.cancel()
+            raise
+        if message is None or message["type"] != "http.response.start":
+            raise RuntimeError("No response returned.")
+        self.status_code = message["status"]
+        self.headers = {key.decode().lower(): value.decode() for key, value in message.get("headers", [])}
+        return self
+
+    async def _next_message(self) -> dict[str, Any] | None:
+        """Return the next message sent downstream, or ``None`` once the app returns."""
+
+        getter = asyncio.ensure_future(self._messages.get())
+        try:
+            await asyncio.wait((getter, self._task), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not getter.done():
+                getter.cancel()
+        if not getter.cancelled():
+            return getter.result()
+        if not self._messages.empty():
+            return self._messages.get_nowait()
+        self._task.result()
+        return None
+
+    async def send(self, send: Callable[[dict[str, Any]], Awaitable[None]]) -> None:
+        headers = [(key.encode(), value.encode()) for key, value in self.headers.items()]
+        try:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": headers})
+            while (message := await self._next_message()) is not None:
+                if message["type"] != "http.response.body":
+                    continue
+                await send(message)
+                if not message.get("more_body", False):
+                    break
+            else:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+        except BaseException:
+            # The client went away (or sending failed); stop the downstream app.
+            self._task.cancel()
+            raise
+        await self._task
 
 
 class BaseHTTPMiddleware:
-    def __init__(self, app: RequestResponseEndpoint, **options: Any) -> None:
+    """Request/response middleware; ``call_next`` streams the downstream response."""
+
+    def __init__(self, app: ASGIApp, **options: Any) -> None:
         self.app = app
         self.options = options
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:  # pragma: no cover - override required
         return await call_next(request)
 
-    async def __call__(self, request: Request) -> Response:
-        return await self.dispatch(request, self.app)
+    async def __call__(self, scope: dict[str, Any], receive: Receive, send: Send) -> None:
+        if scope.get("type") != "http":  # pragma: no cover - lifespan is handled by the app
+            await self.app(scope, receive, send)
+            return
+
+        async def call_next(request: Request) -> Response:
+            return await _DownstreamResponse(self.app, scope, request.receive).start()
+
+        response = await self.dispatch(Request(scope, receive), call_next)
+        await response(scope, receive, send)
 
 
 class ProxyHeadersMiddleware:
-    def __init__(self, app: RequestResponseEndpoint, **_: Any) -> None:
+    def __init__(self, app: ASGIApp, **_: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Receive, send: Send) -> None:
+        await self.app(scope, receive, send)
+
+
+class GZipMiddleware:
+    """Pass-through stand-in; the fallback server never compresses."""
+
+    def __init__(self, app: ASGIApp, **_: Any) -> None:
         self.app = app
 
-    async def __call__(self, request: Request) -> Response:
-        return await self.app(request)
+    async def __call__(self, scope: dict[str, Any], receive: Receive, send: Send) -> None:
+        await self.app(scope, receive, send)
 
 
 @dataclass
@@ -210,12 +319,21 @@ class _Route:
     methods: set[str]
     param_name: str | None = None
     prefix: str | None = None
+    path_format: str | None = None
 
 
 class FastAPI:
-    def __init__(self, *, middleware: list[Middleware] | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        middleware: list[Middleware] | None = None,
+        default_response_class: type[Response] = JSONResponse,
+    ) -> None:
         self._routes: list[_Route] = []
+        self._default_response_class = default_response_class
         self._middleware = middleware or []
+        self._middleware_stack: ASGIApp | None = None
+        self._startup_handlers: list[Callable[[], Any]] = []
         self._shutdown_handlers: list[Callable[[], Any]] = []
 
     def post(self, path: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
@@ -230,23 +348,32 @@ class FastAPI:
                 base = path.split("{", 1)[0].rstrip("/")
                 param_name = path.split("{", 1)[1].split(":", 1)[0]
                 self._routes.append(
-                    _Route(base, func, methods, param_name=param_name, prefix=f"{base}/")
+                    _Route(
+                        base,
+                        func,
+                        methods,
+                        param_name=param_name,
+                        prefix=f"{base}/",
+                        path_format=f"{base}/{{{param_name}}}",
+                    )
                 )
             else:
-                self._routes.append(_Route(path.rstrip("/"), func, methods))
+                self._routes.append(_Route(path.rstrip("/"), func, methods, path_format=path))
             return func
 
         return decorator
 
     def on_event(self, event: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            if event == "shutdown":
+            if event == "startup":
+                self._startup_handlers.append(func)
+            elif event == "shutdown":
                 self._shutdown_handlers.append(func)
             return func
 
         return decorator
 
-    async def __call__(self, scope: dict[str, Any], receive: Callable[[], Awaitable[dict[str, Any]]], send: Callable[[dict[str, Any]], Awaitable[None]]) -> None:
+    async def __call__(self, scope: dict[str, Any], receive: Receive, send: Send) -> None:
         scope_type = scope.get("type")
         if scope_type == "lifespan":
             await self._handle_lifespan(receive, send)
@@ -254,14 +381,23 @@ class FastAPI:
         if scope_type != "http":  # pragma: no cover - unsupported scope
             return
 
+        if self._middleware_stack is None:
+            # Middleware classes are ASGI apps wrapping the router, outermost first.
+            app: ASGIApp = self._route
+            for middleware in reversed(self._middleware):
+                app = middleware.cls(app, **(middleware.options or {}))  # type: ignore[call-arg]
+            self._middleware_stack = app
+        await self._middleware_stack(scope, receive, send)
+
+    async def _route(self, scope: dict[str, Any], receive: Receive, send: Send) -> None:
         request = Request(scope, receive)
         route, params = self._match_route(request.url.path, request.method)
         if route is None:
             response: Response = JSONResponse({"detail": "Not Found"}, status_code=status.HTTP_404_NOT_FOUND)
         else:
-            handler = self._build_handler(route, params)
+            scope["route"] = route
             try:
-                response = await handler(request)
+                response = await self._call_endpoint(route, params, request)
             except HTTPException as exc:
                 response = JSONResponse({"detail": exc.detail}, status_code=exc.status_code)
 
@@ -276,6 +412,10 @@ class FastAPI:
             message = await receive()
             message_type = message.get("type")
             if message_type == "lifespan.startup":
+                for handler in self._startup_handlers:
+                    result = handler()
+                    if asyncio.iscoroutine(result):
+                        await result
                 await send({"type": "lifespan.startup.complete"})
             elif message_type == "lifespan.shutdown":
                 for handler in self._shutdown_handlers:
@@ -285,28 +425,21 @@ class FastAPI:
                 await send({"type": "lifespan.shutdown.complete"})
                 return
 
-    def _build_handler(self, route: _Route, params: dict[str, str]) -> Callable[[Request], Awaitable[Response]]:
-        async def endpoint_handler(request: Request) -> Response:
-            func = route.endpoint
-            call_kwargs: dict[str, Any] = {}
-            if "request" in inspect.signature(func).parameters:
-                call_kwargs["request"] = request
-            call_kwargs.update(params)
-
-            result = func(**call_kwargs)
-            if asyncio.iscoroutine(result):
-                result = await result
-            if isinstance(result, Response):
-                return result
-            if isinstance(result, dict):
-                return JSONResponse(result)
-            return Response(str(result))
-
-        handler: Callable[[Request], Awaitable[Response]] = endpoint_handler
-        for middleware in reversed(self._middleware):
-            options = middleware.options or {}
-            handler = middleware.cls(handler, **options)  # type: ignore[call-arg]
-        return handler
+    async def _call_endpoint(self, route: _Route, params: dict[str, str], request: Request) -> Response:
+        func = route.endpoint
+        call_kwargs: dict[str, Any] = {}
+        if "request" in inspect.signature(func).parameters:
+            call_kwargs["request"] = request
+        call_kwargs.update(params)
+
+        result = func(**call_kwargs)
+        if asyncio.iscoroutine(result):
+            result = await result
+        if isinstance(result, Response):
+            return result
+        if isinstance(result, dict):
+            return self._default_response_class(result)  # type: ignore[call-arg]
+        return Response(str(result))
 
     def _match_route(self, path: str, method: str) -> tuple[_Route | None, dict[str, str]]:
         normalised_path = path.rstrip("/") or "/"
@@ -335,6 +468,11 @@ __all__ = [
     "Middleware",
     "BaseHTTPMiddleware",
     "ProxyHeadersMiddleware",
+    "GZipMiddleware",
     "RequestResponseEndpoint",
+    "ASGIApp",
+    "Receive",
+    "Scope",
+    "Send",
     "status",
 ]
@@ -0,0 +1,29 @@
+"""Compatibility importer for :mod:`orjson` with a stdlib-backed fallback."""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from types import ModuleType
+from typing import Any
+
+from . import _orjson_stub
+
+
+def _load_orjson() -> ModuleType:
+    spec = importlib.util.find_spec("orjson")
+    if spec is not None:
+        return importlib.import_module("orjson")
+    return _orjson_stub
+
+
+_module = _load_orjson()
+__all__ = getattr(_module, "__all__", [name for name in dir(_module) if not name.startswith("_")])
+
+
+def __getattr__(name: str) -> Any:
+    return getattr(_module, name)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(__all__))
@@ -15,7 +15,7 @@ from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompletionRequest:
     """Normalized request payload supplied to completion backends."""
 
@@ -27,7 +27,7 @@ class CompletionRequest:
     metadata: Mapping[str, Any] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompletionResult:
     """Generic backend completion result."""
 
@@ -40,7 +40,7 @@ class CompletionResult:
         return self.completion is not None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StreamEvent:
     """Represents a chunk emitted by a streaming backend."""
 
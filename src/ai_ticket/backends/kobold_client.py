@@ -40,6 +40,15 @@ _TRANSIENT_ERRORS: Final[frozenset[str]] = frozenset(
         "api_response_structure_error",
     }
 )
+# Results are immutable, so outcomes without dynamic detail are shared.
+_MISSING_BASE_URL_RESULT: Final[CompletionResult] = CompletionResult(
+    error="configuration_error",
+    details="KOBOLDCPP_API_URL is not configured.",
+)
+_STREAM_DONE: Final[StreamEvent] = StreamEvent(delta="", done=True)
+# Shared by every request; httpx copies headers into each request, so the
+# mapping is never mutated.
+_REQUEST_HEADERS: Final[dict[str, str]] = {"Content-Type": "application/json"}
 
 
 @dataclass(frozen=True)
@@ -137,18 +146,14 @@ class KoboldBackend(AsyncBackend):
     ) -> CompletionResult:
         if not self._base_url:
             logger.error("KoboldCPP base URL is missing.")
-            return CompletionResult(
-                error="configuration_error",
-                details="KOBOLDCPP_API_URL is not configured.",
-            )
+            return _MISSING_BASE_URL_RESULT
 
         client, cleanup = self._resolve_client(context)
-        headers = {"Content-Type": "application/json"}
         errors: list[CompletionResult] = []
 
         try:
             for endpoint in self._endpoints:
-                result = await self._fetch_from_endpoint(client, endpoint, request, headers)
+                result = await self._fetch_from_endpoint(client, endpoint, request, _REQUEST_HEADERS)
                 if result.is_success():
                     return result
                 errors.append(result)
@@ -188,7 +193,7 @@ class KoboldBackend(AsyncBackend):
         completion = result.completion or ""
         if completion:
             yield StreamEvent(delta=completion, done=False)
-        yield StreamEvent(delta="", done=True)
+        yield _STREAM_DONE
 
     def _resolve_client(
         self, context: BackendContext | None
@@ -214,17 +219,19 @@ class KoboldBackend(AsyncBackend):
         headers: dict[str, str],
     ) -> CompletionResult:
         last_error: CompletionResult | None = None
+        url = f"{self._base_url}{endpoint.path}"
 
         for attempt in range(1, self._max_retries + 1):
-            logger.info(
-                "Attempting KoboldCPP %s endpoint",
-                endpoint.name,
-                extra={"url": f"{self._base_url}{endpoint.path}", "attempt": attempt},
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Attempting KoboldCPP %s endpoint",
+                    endpoint.name,
+                    extra={"url": url, "attempt": attempt},
+                )
 
             try:
                 response = await client.post(
-                    f"{self._base_url}{endpoint.path}",
+                    url,
                     headers=headers,
                     json=endpoint.payload_builder(request),
                     timeout=None,
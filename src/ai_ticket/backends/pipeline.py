@@ -22,6 +22,12 @@ from .base import (
 )
 
 
+_NO_BACKEND_AVAILABLE = CompletionResult(
+    error="no_backend_available",
+    details="All configured backends are unavailable or failed.",
+)
+
+
 @dataclass
 class CircuitBreaker:
     """Simple time-based circuit breaker implementation."""
@@ -117,10 +123,7 @@ class BackendPipeline:
             runtime.breaker.record_failure()
             last_error = result
 
-        return last_error or CompletionResult(
-            error="no_backend_available",
-            details="All configured backends are unavailable or failed.",
-        )
+        return last_error or _NO_BACKEND_AVAILABLE
 
     async def astream(self, request: CompletionRequest) -> AsyncIterator[StreamEvent]:
         last_error: CompletionResult | None = None
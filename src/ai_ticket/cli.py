@@ -5,6 +5,7 @@ import json
 import sys
 import textwrap
 from dataclasses import dataclass
+from importlib.util import find_spec
 from typing import Callable, Mapping
 
 import requests
@@ -52,6 +53,18 @@ def _print_panel(title: str, body: str, style: str = "cyan") -> None:
     print(_panel(title, body, style))
 
 
+def _default_loop() -> str:
+    """Prefer uvloop when installed; otherwise use the stdlib asyncio loop."""
+
+    return "uvloop" if find_spec("uvloop") is not None else "asyncio"
+
+
+def _default_http() -> str:
+    """Prefer the httptools parser when installed; otherwise use h11."""
+
+    return "httptools" if find_spec("httptools") is not None else "h11"
+
+
 def _run_with_uvicorn(options: Mapping[str, object]) -> None:
     import uvicorn
 
@@ -70,6 +83,8 @@ def _serve_command(args: argparse.Namespace, ctx: _CLIContext) -> int:
         "limit_concurrency": args.limit_concurrency,
         "backlog": args.backlog,
         "timeout_keep_alive": args.keepalive,
+        "loop": args.loop,
+        "http": args.http,
     }
 
     summary_parts = [
@@ -77,6 +92,8 @@ def _serve_command(args: argparse.Namespace, ctx: _CLIContext) -> int:
         f"workers={args.workers if not args.reload else 1}",
         f"limit={args.limit_concurrency}",
         f"backlog={args.backlog}",
+        f"loop={args.loop}",
+        f"http={args.http}",
     ]
     if args.reload:
         summary_parts.append("reload")
@@ -205,6 +222,18 @@ def build_parser() -> argparse.ArgumentParser:
         default=2048,
         help="Maximum number of pending connections in the socket backlog.",
     )
+    serve_parser.add_argument(
+        "--loop",
+        choices=("uvloop", "asyncio"),
+        default=_default_loop(),
+        help="Event loop implementation (defaults to uvloop when installed).",
+    )
+    serve_parser.add_argument(
+        "--http",
+        choices=("httptools", "h11"),
+        default=_default_http(),
+        help="HTTP protocol parser (defaults to httptools when installed).",
+    )
     serve_parser.add_argument(
         "--reload",
         action="store_true",
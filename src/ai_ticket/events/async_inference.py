@@ -15,6 +15,8 @@ from .inference import CompletionResponse, ErrorResponse, InferenceResponse
 from .prompt_extraction import PromptExtractionResult, extract_prompt
 from .validation import ValidationError
 
+_logger = logging.getLogger(__name__)
+
 
 async def async_on_event(
     event_data: Mapping[str, Any],
@@ -23,7 +25,7 @@ async def async_on_event(
 ) -> InferenceResponse:
     """Asynchronously handle inference events using the async backend client."""
 
-    logger = logger or logging.getLogger(__name__)
+    logger = logger or _logger
 
     try:
         content_key = validate_inference_event(event_data)
@@ -44,10 +46,11 @@ async def async_on_event(
             details=error.details,
         )
 
-    logger.info(
-        "Submitting prompt to async completion backend",
-        extra={"prompt_preview": extraction.prompt[:80]},
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Submitting prompt to async completion backend",
+            extra={"prompt_preview": extraction.prompt[:80]},
+        )
     backend_result = await async_get_kobold_completion(prompt=extraction.prompt)
 
     if isinstance(backend_result, KoboldCompletionResult) and backend_result.completion:
@@ -12,15 +12,17 @@ from .prompt_extraction import PromptExtractionResult, extract_prompt
 from .validation import ValidationError
 from .common import validate_inference_event
 
+_logger = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CompletionResponse:
     """Successful inference outcome."""
 
     completion: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorResponse:
     """Error outcome suitable for HTTP responses."""
 
@@ -36,7 +38,7 @@ InferenceResponse = CompletionResponse | ErrorResponse
 def on_event(event_data: Mapping[str, Any], *, logger: logging.Logger | None = None) -> InferenceResponse:
     """Handle inference events and return structured responses."""
 
-    logger = logger or logging.getLogger(__name__)
+    logger = logger or _logger
 
     try:
         content_key = validate_inference_event(event_data)
@@ -54,7 +56,8 @@ def on_event(event_data: Mapping[str, Any], *, logger: logging.Logger | None = N
             details=error.details,
         )
 
-    logger.info("Submitting prompt to completion backend", extra={"prompt_preview": extraction.prompt[:80]})
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Submitting prompt to completion backend", extra={"prompt_preview": extraction.prompt[:80]})
     backend_result = get_kobold_completion(prompt=extraction.prompt)
 
     if isinstance(backend_result, KoboldCompletionResult):
@@ -9,7 +9,7 @@ from typing import Any, Iterable, Mapping, Sequence
 from .validation import ValidationError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromptExtractionResult:
     """Structured outcome of a prompt extraction operation."""
 
@@ -17,6 +17,26 @@ class PromptExtractionResult:
 
 
 USER_ROLE = "user"
+# First characters ``json.loads`` accepts after leading whitespace, including
+# the non-standard ``NaN``/``Infinity`` literals it also parses. Plain-text
+# prompts starting with anything else skip the doomed parse attempt.
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+_JSON_WHITESPACE = " \t\n\r"
+
+
+_NOT_JSON = object()
+
+
+def _parse_json_text(text: str) -> Any:
+    """Return ``text`` decoded as JSON, or ``_NOT_JSON`` if it is not a JSON document."""
+
+    stripped = text.lstrip(_JSON_WHITESPACE)
+    if not stripped or stripped[0] not in _JSON_START_CHARS:
+        return _NOT_JSON
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return _NOT_JSON
 
 
 def _is_mapping(value: Any) -> bool:
@@ -69,9 +89,8 @@ def extract_prompt(content: Any) -> PromptExtractionResult:
     details: str | None = None
 
     if isinstance(content, str):
-        try:
-            parsed = json.loads(content)
-        except json.JSONDecodeError:
+        parsed = _parse_json_text(content)
+        if parsed is _NOT_JSON:
             prompt_text = content
         else:
             prompt_text = _prompt_from_parsed_content(parsed)
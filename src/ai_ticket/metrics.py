@@ -3,16 +3,34 @@ from __future__ import annotations
 import importlib.util
 import math
 import threading
-from typing import Dict, Iterable, Tuple
+from typing import Any, Dict, Iterable, Iterator, Tuple
 
 if importlib.util.find_spec("prometheus_client") is not None:  # pragma: no cover - real library path
     from prometheus_client import (  # type: ignore
         CONTENT_TYPE_LATEST,
         Counter,
         Gauge,
+        REGISTRY,
         Histogram,
         generate_latest,
     )
+
+    class _FamilyCollector:
+        """Expose a single collected family through the registry interface."""
+
+        __slots__ = ("_family",)
+
+        def __init__(self, family: Any) -> None:
+            self._family = family
+
+        def collect(self) -> tuple[Any, ...]:
+            return (self._family,)
+
+    def generate_latest_iter() -> Iterator[bytes]:
+        """Yield the exposition output one metric family at a time."""
+
+        for family in REGISTRY.collect():
+            yield generate_latest(_FamilyCollector(family))  # type: ignore[arg-type]
 else:  # pragma: no cover - exercised in CI without prometheus_client
     CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
 
@@ -55,6 +73,52 @@ else:  # pragma: no cover - exercised in CI without prometheus_client
         def render(self) -> list[str]:
             raise NotImplementedError
 
+    class _ShardedValue:
+        """Per-thread accumulators summed only when the metric is read.
+
+        Writers touch a cell owned by their thread, so increments neither race
+        nor contend on a shared lock; scrapes pay for the aggregation instead.
+        Only suitable for add-only values: resetting other threads' cells
+        would race with their unlocked increments, so gauges use
+        :class:`_LockedValue`.
+        """
+
+        def __init__(self) -> None:
+            self._local = threading.local()
+            self._cells: list[list[float]] = []
+            self._lock = threading.Lock()
+
+        def add(self, amount: float) -> None:
+            cell = getattr(self._local, "cell", None)
+            if cell is None:
+                cell = self._local.cell = [0.0]
+                with self._lock:
+                    self._cells.append(cell)
+            cell[0] += amount
+
+        def get(self) -> float:
+            with self._lock:
+                return sum(cell[0] for cell in self._cells)
+
+    class _LockedValue:
+        """Single value guarded by a lock, for metrics that can be ``set``."""
+
+        def __init__(self) -> None:
+            self._lock = threading.Lock()
+            self._value = 0.0
+
+        def add(self, amount: float) -> None:
+            with self._lock:
+                self._value += amount
+
+        def set(self, value: float) -> None:
+            with self._lock:
+                self._value = value
+
+        def get(self) -> float:
+            with self._lock:
+                return self._value
+
     class _ChildBase:
         def __init__(self, metric: _Metric, labelvalues: Tuple[str, ...]) -> None:
             self.metric = metric
@@ -73,12 +137,16 @@ else:  # pragma: no cover - exercised in CI without prometheus_client
         class _Child(_ChildBase):
             def __init__(self, metric: _Metric, labelvalues: Tuple[str, ...]) -> None:
                 super().__init__(metric, labelvalues)
-                self.value = 0.0
+                self._value = _ShardedValue()
+
+            @property
+            def value(self) -> float:
+                return self._value.get()
 
             def inc(self, amount: float = 1.0) -> None:
                 if amount < 0:
                     raise ValueError("Counters can only be increased.")
-                self.value += amount
+                self._value.add(amount)
 
         _child_class = _Child
 
@@ -108,20 +176,20 @@ else:  # pragma: no cover - exercised in CI without prometheus_client
         class _Child(_ChildBase):
             def __init__(self, metric: _Metric, labelvalues: Tuple[str, ...]) -> None:
                 super().__init__(metric, labelvalues)
-                self.value = 0.0
-                self._lock = threading.Lock()
+                self._value = _LockedValue()
+
+            @property
+            def value(self) -> float:
+                return self._value.get()
 
             def inc(self, amount: float = 1.0) -> None:
-                with self._lock:
-                    self.value += amount
+                self._value.add(amount)
 
             def dec(self, amount: float = 1.0) -> None:
-                with self._lock:
-                    self.value -= amount
+                self._value.add(-amount)
 
             def set(self, value: float) -> None:
-                with self._lock:
-                    self.value = value
+                self._value.set(value)
 
         _child_class = _Child
 
@@ -212,8 +280,11 @@ else:  # pragma: no cover - exercised in CI without prometheus_client
                 lines.append(f"{self.name}_count{sum_labels} {child.count}")
             return lines
 
-    def generate_latest() -> bytes:
-        lines: list[str] = []
+    def generate_latest_iter() -> Iterator[bytes]:
+        """Yield the exposition output one metric family at a time."""
+
         for metric in _REGISTRY:
-            lines.extend(metric.render())
-        return ("\n".join(lines) + "\n").encode("utf-8")
+            yield ("\n".join(metric.render()) + "\n").encode("utf-8")
+
+    def generate_latest() -> bytes:
+        return b"".join(generate_latest_iter())
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+import math
 import os
 import threading
 import time
 import uuid
 from collections import deque
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from queue import SimpleQueue
 from statistics import mean
-from typing import Deque, Dict, Iterable, List
+from typing import Any, Callable, Deque, Dict, Iterable, List
 
 from .persistence import MetricsPersistence, SQLiteMetricsPersistence, Totals
 
+logger = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ErrorRecord:
     id: str
     code: str
@@ -22,19 +27,39 @@ class ErrorRecord:
     timestamp: float
 
     def as_dict(self) -> Dict[str, str | float]:
-        payload = asdict(self)
-        payload["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.timestamp))
-        return payload
+        # Flat primitive fields: build the dict directly rather than via the
+        # recursive, deep-copying ``asdict``.
+        return {
+            "id": self.id,
+            "code": self.code,
+            "message": self.message,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.timestamp)),
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Outcome:
     timestamp: float
     success: bool
 
 
 class MetricsStore:
-    """Capture inference metrics for the dashboard."""
+    """Capture inference metrics for the dashboard.
+
+    :meth:`record_event` only appends to a pending deque; a daemon thread
+    folds pending events into the aggregates, persists them and publishes a
+    single snapshot per batch. :meth:`snapshot` and :meth:`flush` drain
+    whatever is still pending first, so readers never see stale totals.
+
+    The sparkline holds one requests-per-minute bucket for each of the last
+    24 minutes, keyed by event timestamp, so batching does not change it.
+    """
+
+    # Events recorded faster than the aggregator drains them beyond this
+    # backlog are dropped, oldest first; see :attr:`dropped_events`.
+    _PENDING_LIMIT = 100_000
+    _SPARKLINE_BUCKETS = 24
+    _SPARKLINE_BUCKET_SECONDS = 60.0
 
     def __init__(
         self,
@@ -49,11 +74,23 @@ class MetricsStore:
         self._latencies: Deque[float] = deque(maxlen=512)
         self._event_timestamps: Deque[float] = deque()
         self._recent_outcomes: Deque[Outcome] = deque(maxlen=128)
-        self._sparkline: Deque[float] = deque([0.0] * 24, maxlen=24)
+        self._sparkline: Deque[float] = deque([0.0] * self._SPARKLINE_BUCKETS, maxlen=self._SPARKLINE_BUCKETS)
+        # End of the newest sparkline bucket; events up to it land in it.
+        self._sparkline_end = time.time()
         self._recent_errors: Deque[ErrorRecord] = deque(maxlen=20)
-        self._subscribers: List[SimpleQueue[dict]] = []
+        # Subscriber queue -> callable delivering a snapshot to it.
+        self._subscribers: Dict[Any, Callable[[dict], None]] = {}
         self._persistence = persistence
         self._retention_seconds = max(retention_seconds, 60.0)
+        self._pending: Deque[tuple[float, float, bool, str | None, str | None]] = deque(
+            maxlen=self._PENDING_LIMIT
+        )
+        self._dropped_events = 0
+        self._dropped_reported = 0
+        self._dropped_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._aggregator: threading.Thread | None = None
 
         if self._persistence is not None:
             self._initialise_from_persistence()
@@ -66,8 +103,75 @@ class MetricsStore:
         error_code: str | None = None,
         message: str | None = None,
     ) -> None:
-        now = time.time()
+        pending = self._pending
+        if len(pending) == self._PENDING_LIMIT:
+            with self._dropped_lock:
+                self._dropped_events += 1
+        pending.append((time.time(), latency_s, success, error_code, message))
+        if self._aggregator is None:
+            self._start_aggregator()
+        if not self._wakeup.is_set():
+            self._wakeup.set()
+
+    @property
+    def dropped_events(self) -> int:
+        """Events discarded because the aggregator backlog was full."""
+
+        return self._dropped_events
+
+    def flush(self) -> None:
+        """Apply pending events and publish the resulting snapshot."""
+
         with self._lock:
+            self._apply_pending_locked()
+
+    def close(self) -> None:
+        """Stop the aggregator thread after applying pending events."""
+
+        self._closed = True
+        self._wakeup.set()
+        aggregator = self._aggregator
+        if aggregator is not None and aggregator is not threading.current_thread():
+            aggregator.join(timeout=1.0)
+        self.flush()
+
+    def _start_aggregator(self) -> None:
+        with self._lock:
+            if self._aggregator is not None:
+                return
+            self._aggregator = threading.Thread(
+                target=self._run_aggregator,
+                name="ai-ticket-metrics",
+                daemon=True,
+            )
+            self._aggregator.start()
+
+    def _run_aggregator(self) -> None:
+        while not self._closed:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            self.flush()
+
+    def _apply_pending_locked(self) -> bool:
+        pending = self._pending
+        if not pending:
+            return False
+
+        dropped = self._dropped_events
+        if dropped != self._dropped_reported:
+            logger.warning(
+                "Metrics backlog full; dropped %d events",
+                dropped - self._dropped_reported,
+                extra={"dropped_events_total": dropped},
+            )
+            self._dropped_reported = dropped
+
+        now = 0.0
+        while pending:
+            try:
+                now, latency_s, success, error_code, message = pending.popleft()
+            except IndexError:  # pragma: no cover - drained concurrently
+                break
             self._total_requests += 1
             if success:
                 self._successes += 1
@@ -77,6 +181,8 @@ class MetricsStore:
             self._latencies.append(latency_ms)
             self._event_timestamps.append(now)
             self._recent_outcomes.append(Outcome(timestamp=now, success=success))
+            self._advance_sparkline_locked(now)
+            self._sparkline[-1] += 1
 
             if error_code:
                 record = ErrorRecord(
@@ -87,10 +193,6 @@ class MetricsStore:
                 )
                 self._recent_errors.appendleft(record)
 
-            self._prune_events_locked(now)
-            throughput_per_minute = self._calculate_throughput_locked(window=60.0, reference=now)
-            self._sparkline.append(throughput_per_minute)
-
             if self._persistence is not None:
                 self._persistence.persist_event(
                     timestamp=now,
@@ -100,32 +202,57 @@ class MetricsStore:
                     message=message,
                 )
 
-            snapshot = self._build_snapshot_locked(now)
-            self._publish_locked(snapshot)
+        self._prune_events_locked(now)
+        snapshot = self._build_snapshot_locked(now)
+        self._publish_locked(snapshot)
+        return True
 
     def snapshot(self) -> dict:
         with self._lock:
+            self._apply_pending_locked()
             now = time.time()
             self._prune_events_locked(now)
             return self._build_snapshot_locked(now)
 
     def snapshot_json(self) -> str:
-        return json.dumps(self.snapshot())
+        return json.dumps(self.snapshot(), separators=(",", ":"))
 
     def subscribe(self) -> SimpleQueue[dict]:
+        """Return a thread-safe queue receiving every published snapshot."""
+
         queue: SimpleQueue[dict] = SimpleQueue()
         with self._lock:
-            self._subscribers.append(queue)
+            self._subscribers[queue] = queue.put
+        return queue
+
+    def subscribe_async(self) -> asyncio.Queue[dict]:
+        """Return an :class:`asyncio.Queue` fed on the running event loop.
+
+        Snapshots are handed over with ``call_soon_threadsafe`` so consumers
+        can ``await queue.get()`` without parking a worker thread per
+        subscriber, whichever thread records the event.
+        """
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[dict] = asyncio.Queue()
+
+        def deliver(snapshot: dict) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, snapshot)
+            except RuntimeError:  # pragma: no cover - loop already closed
+                pass
+
+        with self._lock:
+            self._subscribers[queue] = deliver
         return queue
 
-    def unsubscribe(self, queue: SimpleQueue[dict]) -> None:
+    def unsubscribe(self, queue: Any) -> None:
         with self._lock:
-            if queue in self._subscribers:
-                self._subscribers.remove(queue)
+            self._subscribers.pop(queue, None)
 
     def _publish_locked(self, snapshot: dict) -> None:
-        for queue in list(self._subscribers):
-            queue.put(snapshot)
+        for deliver in list(self._subscribers.values()):
+            deliver(snapshot)
 
     def _prune_events_locked(self, reference_time: float) -> None:
         cutoff = reference_time - self._retention_seconds
@@ -139,6 +266,15 @@ class MetricsStore:
         if self._persistence is not None:
             self._persistence.prune(cutoff=cutoff)
 
+    def _advance_sparkline_locked(self, reference_time: float) -> None:
+        """Open empty buckets until the newest one covers ``reference_time``."""
+
+        if reference_time <= self._sparkline_end:
+            return
+        steps = math.ceil((reference_time - self._sparkline_end) / self._SPARKLINE_BUCKET_SECONDS)
+        self._sparkline.extend([0.0] * min(steps, self._SPARKLINE_BUCKETS))
+        self._sparkline_end += steps * self._SPARKLINE_BUCKET_SECONDS
+
     def _calculate_throughput_locked(self, *, window: float, reference: float) -> float:
         relevant_events = [ts for ts in self._event_timestamps if reference - ts <= window]
         if window <= 0:
@@ -157,7 +293,7 @@ class MetricsStore:
         weight = rank - lower_index
         return values[lower_index] * (1 - weight) + values[upper_index] * weight
 
-    def _build_status_panels_locked(self) -> List[dict]:
+    def _build_status_panels_locked(self, throughput_now: float) -> List[dict]:
         recent_events = list(self._recent_outcomes)[-20:]
         if recent_events:
             failure_ratio = 1 - (sum(1 for outcome in recent_events if outcome.success) / len(recent_events))
@@ -177,7 +313,6 @@ class MetricsStore:
         elif avg_latency > 1200:
             latency_state = "degraded"
 
-        throughput_now = self._sparkline[-1] if self._sparkline else 0.0
         throughput_state = "online"
         if throughput_now < 5 and self._total_requests > 20:
             throughput_state = "degraded"
@@ -208,6 +343,7 @@ class MetricsStore:
         per_minute = self._calculate_throughput_locked(window=60.0, reference=reference_time)
 
         latency_values = list(self._latencies)
+        self._advance_sparkline_locked(reference_time)
 
         snapshot = {
             "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(reference_time)),
@@ -226,7 +362,7 @@ class MetricsStore:
                 "perMinute": per_minute,
             },
             "sparkline": self._normalise_sparkline(list(self._sparkline)),
-            "statusPanels": self._build_status_panels_locked(),
+            "statusPanels": self._build_status_panels_locked(per_minute),
             "recentErrors": [record.as_dict() for record in list(self._recent_errors)],
         }
         return snapshot
@@ -269,21 +405,20 @@ class MetricsStore:
             self._rebuild_sparkline_locked(reference_time)
 
     def _rebuild_sparkline_locked(self, reference_time: float) -> None:
+        width = self._SPARKLINE_BUCKET_SECONDS
         buckets = []
-        for index in range(24):
-            window_end = reference_time - (23 - index) * 60
-            window_start = window_end - 60
+        for index in range(self._SPARKLINE_BUCKETS):
+            window_end = reference_time - (self._SPARKLINE_BUCKETS - 1 - index) * width
+            window_start = window_end - width
             count = sum(
                 1
                 for ts in self._event_timestamps
                 if window_start < ts <= window_end
             )
-            buckets.append(count)
-
-        if not buckets:
-            buckets = [0.0] * 24
+            buckets.append(float(count))
 
-        self._sparkline = deque(buckets, maxlen=24)
+        self._sparkline = deque(buckets, maxlen=self._SPARKLINE_BUCKETS)
+        self._sparkline_end = reference_time
 
 
 _metrics_db_path = os.environ.get("AI_TICKET_METRICS_DB")
@@ -9,14 +9,14 @@ from pathlib import Path
 from typing import Protocol, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Totals:
     requests: int
     successes: int
     errors: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PersistedEvent:
     timestamp: float
     latency_ms: float
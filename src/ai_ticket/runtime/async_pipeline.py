@@ -12,7 +12,7 @@ from ai_ticket.events.async_inference import async_on_event
 from ai_ticket.events.inference import InferenceResponse
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineResult:
     """Container binding an event payload to its inference response."""
 
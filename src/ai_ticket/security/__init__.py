@@ -1,11 +1,12 @@
 """Security utilities for authentication and rate limiting."""
 
 from .auth import TokenManager
-from .rate_limit import BaseRateLimiter, InMemoryRateLimiter, SQLiteRateLimiter
+from .rate_limit import BaseRateLimiter, InMemoryRateLimiter, SQLiteRateLimiter, TokenBucketRateLimiter
 
 __all__ = [
     "TokenManager",
     "BaseRateLimiter",
     "InMemoryRateLimiter",
     "SQLiteRateLimiter",
+    "TokenBucketRateLimiter",
 ]
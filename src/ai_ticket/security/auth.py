@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
+import hmac
 import os
+import re
 import threading
 import time
 from pathlib import Path
-from typing import Iterable, Set
+from typing import Iterable, Mapping
 
 
 class TokenManager:
@@ -14,10 +17,18 @@ class TokenManager:
 
     Tokens can be provided via the ``AI_TICKET_AUTH_TOKEN`` environment variable
     (comma separated) and/or via a file pointed to by
-    ``AI_TICKET_AUTH_TOKEN_FILE``.  The manager re-reads its sources whenever a
-    configurable interval has elapsed or the backing file changes on disk.  This
-    keeps multi-process deployments in sync without requiring a service restart
-    when operators rotate credentials.
+    ``AI_TICKET_AUTH_TOKEN_FILE``.  The manager re-reads its sources once a
+    configurable interval has elapsed, and sooner if the token file's mtime or
+    size changes, so revoking a token from the file takes effect on the next
+    request.  This keeps multi-process deployments in sync without requiring
+    a service restart when operators rotate credentials.  Between intervals a
+    check costs one clock read and one ``stat`` of the token file; the lock is
+    only taken when something needs re-reading.
+
+    Only SHA-256 digests of the tokens are retained, so plaintext credentials
+    do not linger in process memory after loading. Digests are indexed by a
+    short prefix and confirmed with :func:`hmac.compare_digest`; the index is
+    replaced wholesale on reload so lookups can read it without the lock.
     """
 
     def __init__(
@@ -33,17 +44,19 @@ class TokenManager:
         self._env_var = env_var
         self._file_env_var = file_env_var
         self._reload_interval = reload_interval
-        self._tokens: Set[str] = set()
+        self._token_index: Mapping[bytes, bytes] = {}
         self._lock = threading.RLock()
         self._last_loaded: float = 0.0
-        self._file_mtime: float | None = None
         self._file_path: Path | None = None
+        # (path, st_mtime_ns, st_size, digests) of the last parsed token file.
+        self._file_cache: tuple[Path, int, int, frozenset[bytes]] | None = None
         self.reload(force=True)
 
     @property
-    def tokens(self) -> set[str]:
-        with self._lock:
-            return set(self._tokens)
+    def tokens(self) -> set[bytes]:
+        """SHA-256 digests of the currently accepted tokens."""
+
+        return set(self._token_index.values())
 
     @property
     def enabled(self) -> bool:
@@ -51,38 +64,48 @@ class TokenManager:
 
     def has_tokens(self) -> bool:
         self.reload()
-        with self._lock:
-            return bool(self._tokens)
+        return bool(self._token_index)
 
     def is_valid(self, token: str | None) -> bool:
         if token is None:
             return False
         self.reload()
-        with self._lock:
-            return token in self._tokens
+        digest = _digest(token)
+        candidate = self._token_index.get(digest[:_INDEX_PREFIX])
+        return candidate is not None and hmac.compare_digest(candidate, digest)
 
     def reload(self, *, force: bool = False) -> None:
-        now = time.monotonic()
+        if not force and not self._reload_due():
+            return
         with self._lock:
-            file_path = self._resolve_file_path()
-            file_mtime = self._get_file_mtime(file_path)
-            should_reload = force or now - self._last_loaded >= self._reload_interval
-            if file_mtime is not None and self._file_mtime is not None:
-                should_reload = should_reload or file_mtime > self._file_mtime
-            elif file_mtime is not None and self._file_mtime is None:
-                should_reload = True
-
-            if not should_reload:
+            now = time.monotonic()
+            if not force and not self._reload_due():
                 return
 
-            self._tokens = self._load_tokens_from_sources(file_path=file_path)
+            file_path = self._resolve_file_path()
+            self._token_index = _build_index(self._load_tokens_from_sources(file_path=file_path))
             self._last_loaded = now
-            self._file_mtime = file_mtime
             self._file_path = file_path
 
+    def _reload_due(self) -> bool:
+        if time.monotonic() - self._last_loaded >= self._reload_interval:
+            return True
+        file_path = self._file_path
+        if file_path is None:
+            return False
+        cached = self._file_cache
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # A vanished file drops its tokens on reload.
+            return True
+        return cached is None or cached[0] != file_path or (cached[1], cached[2]) != (stat.st_mtime_ns, stat.st_size)
+
     def update_tokens(self, tokens: Iterable[str]) -> None:
         with self._lock:
-            self._tokens = {token.strip() for token in tokens if token and token.strip()}
+            self._token_index = _build_index(
+                map(_digest, filter(None, map(str.strip, filter(None, tokens))))
+            )
             self._last_loaded = time.monotonic()
 
     def _resolve_file_path(self) -> Path | None:
@@ -94,33 +117,50 @@ class TokenManager:
             return None
         return path
 
-    def _get_file_mtime(self, path: Path | None) -> float | None:
-        if path is None:
-            return None
+    def _load_tokens_from_sources(self, *, file_path: Path | None) -> set[bytes]:
+        env_value = os.environ.get(self._env_var, "")
+        digests = set(map(_digest, _ENV_TOKEN_RE.findall(env_value)))
+
+        if file_path is not None:
+            digests.update(self._load_file_digests(file_path))
+
+        return digests
+
+    def _load_file_digests(self, file_path: Path) -> frozenset[bytes]:
+        cached = self._file_cache
         try:
-            return path.stat().st_mtime
+            stat = file_path.stat()
+            if (
+                cached is not None
+                and cached[0] == file_path
+                and cached[1] == stat.st_mtime_ns
+                and cached[2] == stat.st_size
+            ):
+                return cached[3]
+            lines = file_path.read_text().splitlines()
         except OSError:
-            return None
+            # Ignore file read issues; keep previously known tokens.
+            if cached is not None and cached[0] == file_path:
+                return cached[3]
+            return frozenset()
 
-    def _load_tokens_from_sources(self, *, file_path: Path | None) -> set[str]:
-        tokens: set[str] = set()
-        env_value = os.environ.get(self._env_var, "")
-        env_tokens = {token.strip() for token in env_value.split(",") if token.strip()}
-        tokens.update(env_tokens)
+        digests = frozenset(map(_digest, filter(None, map(str.strip, lines))))
+        self._file_cache = (file_path, stat.st_mtime_ns, stat.st_size, digests)
+        return digests
 
-        if file_path is not None:
-            try:
-                file_tokens = {
-                    line.strip()
-                    for line in file_path.read_text().splitlines()
-                    if line.strip()
-                }
-                tokens.update(file_tokens)
-            except OSError:
-                # Ignore file read issues; keep previously known tokens.
-                pass
-
-        return tokens
+
+_INDEX_PREFIX = 8
+# One comma-separated entry with surrounding whitespace trimmed; empty
+# entries (stray or trailing commas) never match.
+_ENV_TOKEN_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+
+def _digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _build_index(digests: Iterable[bytes]) -> dict[bytes, bytes]:
+    return {digest[:_INDEX_PREFIX]: digest for digest in digests}
 
 
 __all__ = ["TokenManager"]
@@ -2,12 +2,28 @@
 
 from __future__ import annotations
 
+import logging
+import os
 import sqlite3
 import threading
 import time
 from pathlib import Path
 from typing import Protocol
 
+logger = logging.getLogger(__name__)
+
+_monotonic = time.monotonic
+
+
+def _default_shard_count() -> int:
+    """Four lock stripes per CPU, rounded up to a power of two for masking."""
+
+    wanted = max(1, (os.cpu_count() or 1) * 4)
+    return 1 << (wanted - 1).bit_length()
+
+
+_DEFAULT_SHARD_COUNT = _default_shard_count()
+
 
 class BaseRateLimiter(Protocol):
     """Interface describing a rate limiter implementation."""
@@ -19,8 +35,32 @@ class BaseRateLimiter(Protocol):
         ...
 
 
+class _Window:
+    """Per-key counters for :class:`InMemoryRateLimiter`, updated in place."""
+
+    __slots__ = ("bucket", "current", "previous")
+
+    def __init__(self, bucket: int) -> None:
+        self.bucket = bucket
+        self.current = 0
+        self.previous = 0
+
+
 class InMemoryRateLimiter:
-    """Simple in-memory sliding window rate limiter."""
+    """In-memory sliding window counter rate limiter.
+
+    Each key keeps request counts for the current and previous fixed windows;
+    the previous count is weighted by how much of it still overlaps the sliding
+    window. This needs O(1) memory and work per key regardless of the limit.
+
+    Client keys are spread over lock-striped shards so concurrent requests from
+    different clients rarely contend. Idle keys are swept from a shard every
+    ``_SWEEP_EVERY`` calls that land on it, keeping memory bounded by the number
+    of recently active clients.
+    """
+
+    _SHARD_COUNT = _DEFAULT_SHARD_COUNT
+    _SWEEP_EVERY = 1024
 
     def __init__(self, limit: int, window_seconds: float) -> None:
         if limit <= 0:
@@ -29,27 +69,138 @@ class InMemoryRateLimiter:
             raise ValueError("window_seconds must be positive")
         self.limit = limit
         self.window_seconds = window_seconds
-        self._events: dict[str, list[float]] = {}
-        self._lock = threading.Lock()
+        self._shards: list[dict[str, _Window]] = [{} for _ in range(self._SHARD_COUNT)]
+        self._locks = [threading.Lock() for _ in range(self._SHARD_COUNT)]
+        self._calls = [0] * self._SHARD_COUNT
 
     def allow(self, key: str) -> tuple[bool, float | None]:
-        now = time.monotonic()
-        with self._lock:
-            events = self._events.setdefault(key, [])
-            cutoff = now - self.window_seconds
-            while events and events[0] <= cutoff:
-                events.pop(0)
+        index = hash(key) & (self._SHARD_COUNT - 1)
+        windows = self._shards[index]
+        limit = self.limit
+        window = self.window_seconds
+        now = _monotonic()
+        bucket = int(now // window)
+        elapsed = now - bucket * window
+        with self._locks[index]:
+            calls = self._calls[index] + 1
+            if calls >= self._SWEEP_EVERY:
+                calls = 0
+                self._sweep(windows, bucket)
+            self._calls[index] = calls
 
-            if len(events) >= self.limit:
-                retry_after = max(self.window_seconds - (now - events[0]), 0.0)
-                return False, retry_after
+            state = windows.get(key)
+            if state is None:
+                state = windows[key] = _Window(bucket)
+            elif state.bucket != bucket:
+                state.previous = state.current if state.bucket == bucket - 1 else 0
+                state.current = 0
+                state.bucket = bucket
+            current = state.current
+            previous = state.previous
+
+            weight = 1.0 - elapsed / window
+            if previous * weight + current >= limit:
+                if current >= limit:
+                    # Wait for the next window, then for the carried-over
+                    # count to decay below the limit.
+                    retry_after = (window - elapsed) + window * (1.0 - limit / current)
+                else:
+                    retry_after = window * (1.0 - (limit - current) / previous) - elapsed
+                return False, max(retry_after, 0.0)
 
-            events.append(now)
+            state.current = current + 1
             return True, None
 
+    @staticmethod
+    def _sweep(windows: dict[str, _Window], bucket: int) -> None:
+        idle = [key for key, state in windows.items() if state.bucket < bucket - 1]
+        for key in idle:
+            del windows[key]
+
+
+class _Bucket:
+    """Per-key state for :class:`TokenBucketRateLimiter`, updated in place."""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float) -> None:
+        self.tokens = tokens
+        self.updated = updated
+
+
+class TokenBucketRateLimiter:
+    """In-memory token bucket rate limiter.
+
+    Each key holds up to ``limit`` tokens, refilled continuously at
+    ``limit / window_seconds`` per second; a request spends one token. Only the
+    token count and last refill time are stored per key, and bursts of up to
+    ``limit`` requests are allowed after an idle period.
+
+    Sharding and sweeping mirror :class:`InMemoryRateLimiter`: a bucket idle
+    for a whole window has refilled completely and is indistinguishable from a
+    new one, so the sweep simply drops it.
+    """
+
+    _SHARD_COUNT = _DEFAULT_SHARD_COUNT
+    _SWEEP_EVERY = 1024
+
+    def __init__(self, limit: int, window_seconds: float) -> None:
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._rate = limit / window_seconds
+        self._shards: list[dict[str, _Bucket]] = [{} for _ in range(self._SHARD_COUNT)]
+        self._locks = [threading.Lock() for _ in range(self._SHARD_COUNT)]
+        self._calls = [0] * self._SHARD_COUNT
+
+    def allow(self, key: str) -> tuple[bool, float | None]:
+        index = hash(key) & (self._SHARD_COUNT - 1)
+        buckets = self._shards[index]
+        now = _monotonic()
+        with self._locks[index]:
+            calls = self._calls[index] + 1
+            if calls >= self._SWEEP_EVERY:
+                calls = 0
+                self._sweep(buckets, now - self.window_seconds)
+            self._calls[index] = calls
+
+            state = buckets.get(key)
+            if state is None:
+                buckets[key] = _Bucket(self.limit - 1.0, now)
+                return True, None
+
+            tokens = state.tokens + (now - state.updated) * self._rate
+            if tokens > self.limit:
+                tokens = float(self.limit)
+            state.updated = now
+            if tokens >= 1.0:
+                state.tokens = tokens - 1.0
+                return True, None
+            state.tokens = tokens
+            return False, (1.0 - tokens) / self._rate
+
+    @staticmethod
+    def _sweep(buckets: dict[str, _Bucket], cutoff: float) -> None:
+        idle = [key for key, state in buckets.items() if state.updated <= cutoff]
+        for key in idle:
+            del buckets[key]
+
 
 class SQLiteRateLimiter:
-    """Rate limiter backed by SQLite for cross-process coordination."""
+    """Rate limiter backed by SQLite for cross-process coordination.
+
+    ``allow()`` is called from the server's event loop, so it shares a single
+    connection guarded by an (uncontended) lock; other processes are
+    serialised by SQLite's WAL locking. ``allow()`` only counts rows inside
+    the window (a range scan on the ``(key, timestamp)`` index) and inserts
+    one; expired rows are left for a daemon thread that sweeps them every
+    ``cleanup_interval`` seconds over its own connection and truncates the
+    WAL. Stored timestamps are wall-clock readings so that processes on
+    different hosts sharing the database agree on the window.
+    """
 
     def __init__(
         self,
@@ -69,25 +220,38 @@ class SQLiteRateLimiter:
         self.limit = limit
         self.window_seconds = window_seconds
         self._cleanup_interval = cleanup_interval
-        self._last_cleanup = 0.0
-        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
 
         path = Path(path)
         if not path.parent.exists():
             path.parent.mkdir(parents=True, exist_ok=True)
-        self._connection = sqlite3.connect(
-            path,
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+        self._connection.execute("PRAGMA journal_mode=WAL;")
+        self._initialise_schema(self._connection)
+        self._cleanup_connection = self._connect()
+
+        self._cleanup_thread = threading.Thread(
+            target=self._cleanup_loop,
+            name="ai-ticket-rate-limit-cleanup",
+            daemon=True,
+        )
+        self._cleanup_thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._path,
             check_same_thread=False,
             isolation_level=None,
-            detect_types=sqlite3.PARSE_DECLTYPES,
         )
-        self._connection.execute("PRAGMA journal_mode=WAL;")
-        self._connection.execute("PRAGMA synchronous=NORMAL;")
-        self._initialise_schema()
+        connection.execute("PRAGMA synchronous=NORMAL;")
+        connection.execute("PRAGMA temp_store=MEMORY;")
+        return connection
 
-    def _initialise_schema(self) -> None:
-        with self._connection:
-            self._connection.execute(
+    def _initialise_schema(self, connection: sqlite3.Connection) -> None:
+        with connection:
+            connection.execute(
                 """
                 CREATE TABLE IF NOT EXISTS rate_limit_events (
                     key TEXT NOT NULL,
@@ -95,10 +259,14 @@ class SQLiteRateLimiter:
                 )
                 """
             )
-            self._connection.execute(
-                "CREATE INDEX IF NOT EXISTS idx_rate_limit_key ON rate_limit_events(key)"
+            # The composite index answers the per-key window count on its
+            # own; it supersedes the former key-only index.
+            connection.execute("DROP INDEX IF EXISTS idx_rate_limit_key")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_rate_limit_key_timestamp "
+                "ON rate_limit_events(key, timestamp)"
             )
-            self._connection.execute(
+            connection.execute(
                 "CREATE INDEX IF NOT EXISTS idx_rate_limit_timestamp ON rate_limit_events(timestamp)"
             )
 
@@ -106,18 +274,15 @@ class SQLiteRateLimiter:
         now = time.time()
         cutoff = now - self.window_seconds
 
-        with self._lock:
-            self._maybe_cleanup(cutoff)
-            cursor = self._connection.cursor()
-            cursor.execute(
-                "DELETE FROM rate_limit_events WHERE key = ? AND timestamp < ?",
+        connection = self._connection
+        # BEGIN IMMEDIATE takes the database write lock up front so the
+        # count-then-insert sequence is atomic across processes.
+        with self._lock, connection:
+            connection.execute("BEGIN IMMEDIATE")
+            count, oldest = connection.execute(
+                "SELECT COUNT(*), MIN(timestamp) FROM rate_limit_events WHERE key = ? AND timestamp >= ?",
                 (key, cutoff),
-            )
-            cursor.execute(
-                "SELECT COUNT(*), MIN(timestamp) FROM rate_limit_events WHERE key = ?",
-                (key,),
-            )
-            count, oldest = cursor.fetchone()
+            ).fetchone()
             if count is None:
                 count = 0
 
@@ -125,29 +290,37 @@ class SQLiteRateLimiter:
                 retry_after = None
                 if oldest is not None:
                     retry_after = max(self.window_seconds - (now - float(oldest)), 0.0)
-                cursor.close()
                 return False, retry_after
 
-            cursor.execute(
+            connection.execute(
                 "INSERT INTO rate_limit_events(key, timestamp) VALUES (?, ?)",
                 (key, now),
             )
-            cursor.close()
             return True, None
 
-    def _maybe_cleanup(self, cutoff: float) -> None:
-        now = time.time()
-        if now - self._last_cleanup < self._cleanup_interval:
-            return
-        self._last_cleanup = now
-        self._connection.execute(
-            "DELETE FROM rate_limit_events WHERE timestamp < ?",
-            (cutoff,),
-        )
+    def _cleanup_loop(self) -> None:
+        while not self._stop_event.wait(self._cleanup_interval):
+            self._cleanup()
+
+    def _cleanup(self) -> None:
+        connection = self._cleanup_connection
+        try:
+            connection.execute(
+                "DELETE FROM rate_limit_events WHERE timestamp < ?",
+                (time.time() - self.window_seconds,),
+            )
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+        except sqlite3.Error:
+            # Another process may hold the write lock; the next sweep retries.
+            logger.debug("Rate limiter cleanup skipped", exc_info=True)
 
     def close(self) -> None:
+        self._stop_event.set()
+        if self._cleanup_thread is not threading.current_thread():
+            self._cleanup_thread.join()
         with self._lock:
             self._connection.close()
+        self._cleanup_connection.close()
 
 
-__all__ = ["BaseRateLimiter", "InMemoryRateLimiter", "SQLiteRateLimiter"]
+__all__ = ["BaseRateLimiter", "InMemoryRateLimiter", "SQLiteRateLimiter", "TokenBucketRateLimiter"]
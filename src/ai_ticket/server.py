@@ -1,25 +1,38 @@
 from __future__ import annotations
 
+import asyncio
 import atexit
+import hashlib
 import json
 import logging
+import mimetypes
 import os
 import signal
+import sys
 import threading
 import time
-from dataclasses import asdict, is_dataclass
+from array import array
+from collections import deque
+from dataclasses import fields, is_dataclass
+from itertools import count as _count, islice
 from pathlib import Path
-from time import perf_counter
-from typing import Any, AsyncGenerator, Mapping
+from typing import Any, AsyncGenerator, Callable, Mapping
 
 import anyio
 
+try:  # pragma: no cover - POSIX only
+    import resource
+except ImportError:  # pragma: no cover - e.g. Windows
+    resource = None  # type: ignore[assignment]
+
 try:  # pragma: no cover - prefer real FastAPI when available
     from fastapi import FastAPI, HTTPException, Request, Response, status
     from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
     from starlette.middleware import Middleware
     from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-    from starlette.middleware.proxy_headers import ProxyHeadersMiddleware
+    from starlette.middleware.gzip import GZipMiddleware
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+    from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 except ImportError:  # pragma: no cover - fallback for test environments without FastAPI
     from ai_ticket._compat.fastapi import (  # type: ignore
         FastAPI,
@@ -33,18 +46,26 @@ except ImportError:  # pragma: no cover - fallback for test environments without
         Middleware,
         BaseHTTPMiddleware,
         RequestResponseEndpoint,
+        GZipMiddleware,
         ProxyHeadersMiddleware,
+        ASGIApp,
+        Receive,
+        Scope,
+        Send,
     )
 
+    Message = dict[str, Any]  # type: ignore[misc]
+
+from ai_ticket._compat import orjson
 from ai_ticket.backends.base import StreamEvent, StreamingNotSupported
 from ai_ticket.backends.kobold_client import async_stream_kobold_completion
 from ai_ticket.events.common import validate_inference_event
 from ai_ticket.events.inference import CompletionResponse, ErrorResponse, on_event
 from ai_ticket.events.prompt_extraction import PromptExtractionResult, extract_prompt
 from ai_ticket.events.validation import ValidationError
-from ai_ticket.metrics import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+from ai_ticket.metrics import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest_iter
 from ai_ticket.observability import metrics_store
-from ai_ticket.security import InMemoryRateLimiter, SQLiteRateLimiter, TokenManager
+from ai_ticket.security import InMemoryRateLimiter, SQLiteRateLimiter, TokenBucketRateLimiter, TokenManager
 from ai_ticket.ui import get_ui_dist_path
 
 try:  # pragma: no cover - optional dependency path
@@ -52,56 +73,114 @@ try:  # pragma: no cover - optional dependency path
 except ImportError:  # pragma: no cover - exercised when prometheus is absent
     REGISTRY = None  # type: ignore[assignment]
 
+_orjson_dumps = orjson.dumps
+_orjson_loads = orjson.loads
+_monotonic_ns = time.monotonic_ns
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with :mod:`orjson` (or its stdlib fallback)."""
+
+    def render(self, content: Any) -> bytes:
+        return _orjson_dumps(content, option=_ORJSON_OPTIONS)
+
+
+def _json_response(content: Any, status_code: int = 200) -> Response:
+    """Return a plain :class:`Response` carrying ``content`` as JSON bytes.
+
+    ``bytes`` are sent verbatim, anything else is serialised with orjson. The
+    route hands back a finished ``Response`` so FastAPI skips its response
+    model and ``jsonable_encoder`` machinery entirely.
+    """
+
+    body = content if isinstance(content, bytes) else _orjson_dumps(content, option=_ORJSON_OPTIONS)
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
 
 class JsonFormatter(logging.Formatter):
     """Emit JSON-formatted log records with structured extras."""
 
-    _STANDARD_ATTRS = {
-        "args",
-        "asctime",
-        "created",
-        "exc_info",
-        "exc_text",
-        "filename",
-        "funcName",
-        "levelname",
-        "levelno",
-        "lineno",
-        "module",
-        "msecs",
-        "message",
-        "msg",
-        "name",
-        "pathname",
-        "process",
-        "processName",
-        "relativeCreated",
-        "stack_info",
-        "thread",
-        "threadName",
-    }
+    _STANDARD_ATTRS = frozenset(
+        {
+            "args",
+            "asctime",
+            "created",
+            "exc_info",
+            "exc_text",
+            "filename",
+            "funcName",
+            "levelname",
+            "levelno",
+            "lineno",
+            "module",
+            "msecs",
+            "message",
+            "msg",
+            "name",
+            "pathname",
+            "process",
+            "processName",
+            "relativeCreated",
+            "stack_info",
+            "taskName",
+            "thread",
+            "threadName",
+        }
+    )
+
+    # (epoch second, formatted "%Y-%m-%d %H:%M:%S") shared by records logged
+    # within the same second.
+    _time_cache: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:  # noqa: N802
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, prefix = self._time_cache
+        if cached_second != second:
+            prefix = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
+
+    # Serialised '{"level":...,"logger":...,' heads keyed by (logger, level);
+    # only the per-record tail is encoded on each call.
+    _prefix_cache: dict[tuple[str, str], str] = {}
+
+    def _prefix(self, name: str, levelname: str) -> str:
+        key = (name, levelname)
+        prefix = self._prefix_cache.get(key)
+        if prefix is None:
+            head = _orjson_dumps({"level": levelname, "logger": name}).decode()
+            prefix = self._prefix_cache[key] = head[:-1] + ","
+        return prefix
 
     def format(self, record: logging.LogRecord) -> str:  # noqa: D401
-        record_message = record.getMessage()
         structured: dict[str, Any] = {
-            "level": record.levelname,
-            "message": record_message,
-            "logger": record.name,
+            "message": record.getMessage(),
             "time": self.formatTime(record, self.datefmt),
         }
 
-        extras = {
-            key: value
-            for key, value in record.__dict__.items()
-            if key not in self._STANDARD_ATTRS and not key.startswith("_")
-        }
-        if extras:
-            structured["extra"] = extras
+        attributes = record.__dict__
+        extra_keys = attributes.keys() - self._STANDARD_ATTRS
+        if extra_keys:
+            extras = {
+                key: value
+                for key, value in attributes.items()
+                if key in extra_keys and not key.startswith("_")
+            }
+            if extras:
+                structured["extra"] = extras
 
         if record.exc_info:
             structured["exc_info"] = self.formatException(record.exc_info)
 
-        return json.dumps(structured, default=str)
+        try:
+            tail = _orjson_dumps(structured, default=str, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:  # pragma: no cover - e.g. integers beyond 64 bits
+            structured = {"level": record.levelname, "logger": record.name, **structured}
+            return json.dumps(structured, default=str)
+        return self._prefix(record.name, record.levelname) + tail[1:].decode()
 
 
 def configure_logging() -> None:
@@ -138,7 +217,7 @@ def _unregister_previous_metric_collectors(metric_names: list[str]) -> None:
 
 
 def _configure_metrics() -> None:
-    global REQUEST_COUNTER, REQUEST_ERRORS, REQUEST_LATENCY, IN_FLIGHT_GAUGE
+    global REQUEST_COUNTER, REQUEST_ERRORS, REQUEST_LATENCY, IN_FLIGHT_GAUGE, RSS_GAUGE
     if REQUEST_COUNTER is not None:
         return
 
@@ -155,6 +234,7 @@ def _configure_metrics() -> None:
             f"{METRICS_NAMESPACE}_http_request_duration_seconds_count",
             f"{METRICS_NAMESPACE}_http_request_duration_seconds_sum",
             f"{METRICS_NAMESPACE}_http_requests_in_flight",
+            f"{METRICS_NAMESPACE}_worker_max_rss_bytes",
         ]
     )
 
@@ -181,46 +261,185 @@ def _configure_metrics() -> None:
         "Current number of in-flight HTTP requests",
         namespace=METRICS_NAMESPACE,
     )
+    RSS_GAUGE = Gauge(
+        "worker_max_rss_bytes",
+        "Peak resident set size of the worker process",
+        ["pid"],
+        namespace=METRICS_NAMESPACE,
+    )
+    _REQUEST_BINDINGS.clear()
+
+
+def _mark_shutdown() -> None:
+    _SHUTDOWN_FLAG[0] = 1
+    shutdown_event.set()
+    loop, event = _async_shutdown_loop, _async_shutdown
+    if loop is not None and event is not None:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:  # pragma: no cover - loop already closed
+            pass
+
+
+def _async_shutdown_event() -> asyncio.Event:
+    """Return the shutdown :class:`asyncio.Event` for the running loop.
+
+    Signal handlers may run on any thread, so :func:`_mark_shutdown` sets the
+    event through ``call_soon_threadsafe`` on the loop it was bound to.
+    """
+
+    global _async_shutdown, _async_shutdown_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_shutdown is None or _async_shutdown_loop is not loop:
+        _async_shutdown = asyncio.Event()
+        _async_shutdown_loop = loop
+        if _SHUTDOWN_FLAG[0]:
+            _async_shutdown.set()
+    return _async_shutdown
 
 
 def _handle_shutdown_signal(signum: int, _frame: Any | None) -> None:
     logger.info("Received shutdown signal", extra={"signal": signum})
-    shutdown_event.set()
+    _mark_shutdown()
+
+
+class _ChainedExitHandler:
+    """Mark shutdown, then hand the signal to the handler it replaced."""
+
+    __slots__ = ("previous",)
+
+    def __init__(self, previous: Callable[[int, Any], Any] | None) -> None:
+        self.previous = previous
+
+    def __call__(self, signum: int, frame: Any | None) -> None:
+        _handle_shutdown_signal(signum, frame)
+        if self.previous is not None:
+            self.previous(signum, frame)
+
+
+def _install_exit_signal_handlers() -> None:
+    """Observe SIGTERM/SIGINT without displacing the ASGI server's handlers.
+
+    Uvicorn installs its own exit handlers for the whole serve and only runs
+    lifespan shutdown once every connection has closed, so open SSE streams
+    would never learn about the shutdown. Wrapping whatever handler is in
+    place (here at import and again at startup, after the server swapped in
+    its own) lets streams end as soon as the signal arrives.
+    """
+
+    if threading.current_thread() is not threading.main_thread():
+        return
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        current = signal.getsignal(signum)
+        if isinstance(current, _ChainedExitHandler):
+            continue
+        previous = current if callable(current) and current is not signal.default_int_handler else None
+        signal.signal(signum, _ChainedExitHandler(previous))
+
+
+def _handle_reload_signal(signum: int, _frame: Any | None) -> None:
+    logger.info("Received reload signal; refreshing authentication tokens", extra={"signal": signum})
+    TOKEN_MANAGER.reload(force=True)
 
 
 def _handle_process_exit() -> None:
     root_logger = logging.getLogger()
-    for handler in root_logger.handlers:
-        stream = getattr(handler, "stream", None)
-        if stream is not None and getattr(stream, "closed", False):
-            break
-    else:
+    streams_closed = any(
+        getattr(getattr(handler, "stream", None), "closed", False) for handler in root_logger.handlers
+    )
+    if not streams_closed:
         logger.info("Process exiting; flushing logs and metrics")
+    _drain_latency_queue()
+    metrics_store.close()
     logging.shutdown()
 
 
+_BEARER_PREFIXES = ("Bearer ", "bearer ")
+
+
 def _extract_bearer_token(headers: Mapping[str, str]) -> str | None:
-    auth_header: str | None = None
-    for key, value in headers.items():
-        if key.lower() == "authorization":
-            auth_header = value
-            break
+    """Return the bearer token from ``headers``, which must use lower-case keys.
+
+    Request headers are passed through as-is; Starlette already lower-cases
+    names and resolves lookups case-insensitively.
+    """
+
+    auth_header = headers.get("authorization")
     if not auth_header:
         return None
-    scheme, _, token = auth_header.partition(" ")
-    if scheme.lower() != "bearer" or not token:
+    if auth_header.startswith(_BEARER_PREFIXES) or auth_header[:7].lower() == "bearer ":
+        return auth_header[7:].strip() or None
+    return None
+
+
+def _credentials_accepted(headers: Mapping[str, str]) -> bool | None:
+    """Return whether the request's credential is valid, or ``None`` if absent.
+
+    Results are deliberately not memoised: a cache keyed by header values
+    would keep plaintext credentials in memory, while
+    :meth:`TokenManager.is_valid` only needs one SHA-256 and a dict lookup.
+    """
+
+    token = _extract_bearer_token(headers) or headers.get("x-api-key")
+    if not token:
         return None
-    return token.strip()
+    return TOKEN_MANAGER.is_valid(token)
 
 
-def _normalise_response(response: Any) -> dict[str, Any]:
-    if is_dataclass(response):
-        return asdict(response)
-    if isinstance(response, Mapping):
-        return dict(response)
+# Field names per dataclass type, resolved once instead of on every response.
+_DATACLASS_FIELDS: dict[type, tuple[str, ...]] = {}
+
+
+def _dataclass_payload(instance: Any) -> dict[str, Any]:
+    """Shallow field dict for ``instance``; nested values are left for orjson."""
+
+    cls = type(instance)
+    names = _DATACLASS_FIELDS.get(cls)
+    if names is None:
+        names = _DATACLASS_FIELDS[cls] = tuple(field.name for field in fields(cls))
+    return {name: getattr(instance, name) for name in names}
+
+
+def _identity(response: dict[str, Any]) -> dict[str, Any]:
+    return response
+
+
+def _wrap_result(response: Any) -> dict[str, Any]:
     return {"result": response}
 
 
+def _resolve_normaliser(cls: type) -> Callable[[Any], dict[str, Any]]:
+    if issubclass(cls, dict):
+        return _identity
+    if is_dataclass(cls):
+        return _dataclass_payload
+    if issubclass(cls, Mapping):
+        return dict
+    return _wrap_result
+
+
+# Response type -> coercion, so the dataclass/ABC checks run once per type.
+_NORMALISERS: dict[type, Callable[[Any], dict[str, Any]]] = {}
+
+
+def _normalise_response(response: Any) -> dict[str, Any]:
+    """Coerce a legacy handler result into a JSON object without copying dicts."""
+
+    cls = type(response)
+    normalise = _NORMALISERS.get(cls)
+    if normalise is None:
+        normalise = _NORMALISERS[cls] = _resolve_normaliser(cls)
+    return normalise(response)
+
+
+def _sse_frame(payload: Any) -> bytes:
+    return b"data: " + _orjson_dumps(payload, option=_ORJSON_OPTIONS) + b"\n\n"
+
+
+_SHUTDOWN_FRAME = _sse_frame({"done": True, "reason": "shutdown"})
+
+
 def _serialize_stream_event(event: StreamEvent) -> dict[str, Any]:
     payload: dict[str, Any] = {"delta": event.delta, "done": event.done}
     if event.metadata is not None:
@@ -228,8 +447,8 @@ def _serialize_stream_event(event: StreamEvent) -> dict[str, Any]:
     return payload
 
 
-def _streaming_error_response(error: ErrorResponse, *, start: float) -> StreamingResponse:
-    duration = perf_counter() - start
+def _streaming_error_response(error: ErrorResponse, *, start_ns: int) -> Response:
+    duration = (_monotonic_ns() - start_ns) * 1e-9
     metrics_store.record_event(
         latency_s=duration,
         success=False,
@@ -241,21 +460,20 @@ def _streaming_error_response(error: ErrorResponse, *, start: float) -> Streamin
     if error.details is not None:
         payload["details"] = error.details
 
-    async def _event_stream() -> AsyncGenerator[str, None]:
-        yield f"data: {json.dumps(payload)}\n\n"
-
-    return StreamingResponse(_event_stream(), media_type="text/event-stream", status_code=error.status_code)
+    # A single-frame stream needs no generator; send the frame as the body.
+    return Response(content=_sse_frame(payload), media_type="text/event-stream", status_code=error.status_code)
 
 
 def _build_streaming_success_response(
     prompt: str,
     *,
-    start: float,
+    start_ns: int,
     kobold_url: str | None = None,
 ) -> StreamingResponse:
-    logger.info("Starting streaming completion", extra={"prompt_preview": prompt[:80]})
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Starting streaming completion", extra={"prompt_preview": prompt[:80]})
 
-    async def _event_stream() -> AsyncGenerator[str, None]:
+    async def _event_stream() -> AsyncGenerator[bytes, None]:
         success = False
         error: tuple[str, str] | None = None
         try:
@@ -263,8 +481,12 @@ def _build_streaming_success_response(
                 prompt=prompt,
                 kobold_url=kobold_url,
             ):
+                if _SHUTDOWN_FLAG[0]:
+                    error = ("server_shutdown", "Server is shutting down.")
+                    yield _SHUTDOWN_FRAME
+                    return
                 payload = _serialize_stream_event(chunk)
-                yield f"data: {json.dumps(payload)}\n\n"
+                yield _sse_frame(payload)
             success = True
         except StreamingNotSupported as exc:
             logger.warning(
@@ -276,7 +498,7 @@ def _build_streaming_success_response(
                 "details": str(exc),
                 "done": True,
             }
-            yield f"data: {json.dumps(error_payload)}\n\n"
+            yield _sse_frame(error_payload)
         except Exception as exc:  # pragma: no cover - defensive safeguard
             logger.exception("Streaming backend failure", extra={"error": str(exc)})
             error = ("streaming_error", str(exc))
@@ -285,9 +507,9 @@ def _build_streaming_success_response(
                 "details": str(exc),
                 "done": True,
             }
-            yield f"data: {json.dumps(error_payload)}\n\n"
+            yield _sse_frame(error_payload)
         finally:
-            duration = perf_counter() - start
+            duration = (_monotonic_ns() - start_ns) * 1e-9
             if success:
                 metrics_store.record_event(latency_s=duration, success=True)
             else:
@@ -305,10 +527,21 @@ def _build_streaming_success_response(
     return StreamingResponse(_event_stream(), media_type="text/event-stream")
 
 
-def _handle_streaming_event(event_data: Mapping[str, Any], *, start: float) -> Response:
+# Bodies up to this size validate faster inline than a threadpool hop costs.
+_INLINE_VALIDATION_BYTES = 1024
+
+
+def _validate_and_extract(event_data: Mapping[str, Any]) -> PromptExtractionResult:
+    content_key = validate_inference_event(event_data)
+    return extract_prompt(event_data[content_key])
+
+
+async def _handle_streaming_event(event_data: Mapping[str, Any], *, start_ns: int, body_size: int) -> Response:
     try:
-        content_key = validate_inference_event(event_data)
-        extraction: PromptExtractionResult = extract_prompt(event_data[content_key])
+        if body_size <= _INLINE_VALIDATION_BYTES:
+            extraction = _validate_and_extract(event_data)
+        else:
+            extraction = await anyio.to_thread.run_sync(_validate_and_extract, event_data)
     except ValidationError as error:
         logger.warning(
             "Streaming inference validation failed",
@@ -324,12 +557,12 @@ def _handle_streaming_event(event_data: Mapping[str, Any], *, start: float) -> R
             status_code=error.status_code,
             details=error.details,
         )
-        return _streaming_error_response(error_response, start=start)
+        return _streaming_error_response(error_response, start_ns=start_ns)
 
     kobold_url = event_data.get("kobold_url") if isinstance(event_data, Mapping) else None
     return _build_streaming_success_response(
         extraction.prompt,
-        start=start,
+        start_ns=start_ns,
         kobold_url=str(kobold_url) if kobold_url else None,
     )
 
@@ -343,6 +576,10 @@ try:
 except ValueError:
     _token_reload_interval = 30.0
 TOKEN_MANAGER = TokenManager(reload_interval=max(_token_reload_interval, 1.0))
+try:
+    MAX_BODY_BYTES = int(os.environ.get("MAX_BODY_BYTES", "1048576"))
+except ValueError:
+    MAX_BODY_BYTES = 1048576
 RATE_LIMIT_REQUESTS = int(os.environ.get("RATE_LIMIT_REQUESTS", "120"))
 RATE_LIMIT_WINDOW_SECONDS = float(os.environ.get("RATE_LIMIT_WINDOW_SECONDS", "60"))
 RATE_LIMIT_BACKEND = os.environ.get("RATE_LIMIT_BACKEND", "memory").lower()
@@ -361,11 +598,18 @@ if RATE_LIMIT_REQUESTS > 0 and RATE_LIMIT_WINDOW_SECONDS > 0:
             window_seconds=RATE_LIMIT_WINDOW_SECONDS,
             cleanup_interval=rate_limit_cleanup_interval,
         )
-    else:
+    elif RATE_LIMIT_BACKEND == "sliding_window":
         RATE_LIMITER = InMemoryRateLimiter(
             RATE_LIMIT_REQUESTS,
             RATE_LIMIT_WINDOW_SECONDS,
         )
+    else:
+        # ``memory`` (the default) and ``token_bucket``: two floats per client
+        # and O(1) arithmetic per check.
+        RATE_LIMITER = TokenBucketRateLimiter(
+            RATE_LIMIT_REQUESTS,
+            RATE_LIMIT_WINDOW_SECONDS,
+        )
 else:
     RATE_LIMITER = None
 METRICS_NAMESPACE = os.environ.get("METRICS_NAMESPACE", "ai_ticket")
@@ -374,43 +618,90 @@ REQUEST_COUNTER: Counter | None = None
 REQUEST_ERRORS: Counter | None = None
 REQUEST_LATENCY: Histogram | None = None
 IN_FLIGHT_GAUGE: Gauge | None = None
+RSS_GAUGE: Gauge | None = None
+
+# The RSS gauge is refreshed on every ``_RSS_SAMPLE_MASK + 1``-th request.
+_RSS_SAMPLE_MASK = 127
+_REQUEST_SEQUENCE = _count()
+# ``ru_maxrss`` is reported in KiB on Linux and in bytes on macOS.
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+_LABEL_CACHE_LIMIT = 1024
+# ``(method, path, status)`` -> bound ``inc``/``observe`` methods of the
+# labelled children, so recording a request is one dict lookup plus calls.
+_REQUEST_BINDINGS: dict[tuple[str, str, int], tuple[Any, Any, Any]] = {}
+
+# Histogram observations wait here as (bound observe, seconds) pairs. A daemon
+# thread applies them every ``_LATENCY_DRAIN_INTERVAL`` seconds and scrapes
+# drain the rest first, so the child's lock is never taken on the request path.
+# Outside a scrape the histogram may therefore lag ``requests_total`` by up to
+# one interval (250ms). Once ``_LATENCY_QUEUE_LIMIT`` observations are waiting
+# the request applies its own inline, so a stalled drainer costs latency
+# rather than histogram counts.
+_LATENCY_QUEUE: deque[tuple[Callable[[float], None], float]] = deque()
+_LATENCY_QUEUE_LIMIT = 65536
+_LATENCY_DRAIN_INTERVAL = 0.25
+_latency_drainer: threading.Thread | None = None
+_latency_drainer_lock = threading.Lock()
 
 _configure_metrics()
 
 shutdown_event = threading.Event()
-signal.signal(signal.SIGTERM, _handle_shutdown_signal)
-signal.signal(signal.SIGINT, _handle_shutdown_signal)
+# Mirrors ``shutdown_event`` for the /health hot path: indexing a one-byte
+# array avoids the Event method dispatch. Waiters keep using the Event.
+_SHUTDOWN_FLAG = array("b", [0])
+# Awaitable mirror for long-lived streams, bound lazily to the serving loop.
+_async_shutdown: asyncio.Event | None = None
+_async_shutdown_loop: asyncio.AbstractEventLoop | None = None
+_install_exit_signal_handlers()
+if hasattr(signal, "SIGHUP"):  # pragma: no branch - unavailable on Windows
+    signal.signal(signal.SIGHUP, _handle_reload_signal)
 atexit.register(_handle_process_exit)
 
-EXEMPT_PATHS = {"/health", "/metrics"}
+EXEMPT_PATHS = frozenset({"/health", "/metrics"})
+# Load-balancer probes are counted but not timed; their latency says nothing
+# about the service and they dominate histogram updates.
+_UNTIMED_ENDPOINTS = frozenset({"/health"})
+_COMPLETION_RESPONSE_KEYS = tuple(field.name for field in fields(CompletionResponse))
 
 
 class SecurityMiddleware(BaseHTTPMiddleware):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Health probes and scrapes skip the BaseHTTPMiddleware request
+        # wrapping and streaming plumbing entirely, as does every request
+        # while neither authentication nor rate limiting is configured.
+        if scope["type"] == "http" and (
+            scope["path"] in EXEMPT_PATHS or (RATE_LIMITER is None and not TOKEN_MANAGER.has_tokens())
+        ):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        path = request.url.path
+        path = request.scope["path"]
         if path in EXEMPT_PATHS:
             return await call_next(request)
 
-        headers = {key: value for key, value in request.headers.items()}
+        headers = request.headers
 
         if TOKEN_MANAGER.has_tokens():
-            provided_token = _extract_bearer_token(headers) or headers.get("X-API-Key")
-            if not provided_token:
+            accepted = _credentials_accepted(headers)
+            if accepted is None:
                 logger.warning("Missing authentication token", extra={"path": path})
-                return JSONResponse(
+                return ORJSONResponse(
                     {"error": "unauthorised", "details": "Authentication token missing."},
                     status_code=status.HTTP_401_UNAUTHORIZED,
                 )
 
-            if not TOKEN_MANAGER.is_valid(provided_token):
+            if not accepted:
                 logger.warning("Invalid authentication token", extra={"path": path})
-                return JSONResponse(
+                return ORJSONResponse(
                     {"error": "forbidden", "details": "Invalid authentication token."},
                     status_code=status.HTTP_403_FORBIDDEN,
                 )
 
         if RATE_LIMITER is not None:
-            client_identifier = headers.get("X-Forwarded-For")
+            client_identifier = headers.get("x-forwarded-for")
             if not client_identifier:
                 client = request.client
                 client_identifier = client.host if client else "unknown"
@@ -420,7 +711,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
                     "Request rate limited",
                     extra={"client": client_identifier, "retry_after": retry_after, "path": path},
                 )
-                response = JSONResponse(
+                response = ORJSONResponse(
                     {"error": "rate_limited", "details": "Too many requests."},
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 )
@@ -431,63 +722,206 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        path = request.url.path
-        method = request.method
+def _endpoint_label(scope: Mapping[str, Any]) -> str:
+    # Label by the matched route template rather than the raw path so
+    # parameterised routes such as ``/dashboard/{asset_path}`` map to a
+    # single series; the label set is bounded by the route table.
+    return getattr(scope.get("route"), "path_format", None) or "unmatched"
+
+
+_PROCESSED_BY_HEADER = (b"x-request-processed-by", b"ai-ticket")
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware counting and timing HTTP requests.
 
+    Requests are recorded when the response starts, so a long-lived stream
+    is timed to its first byte and leaves the in-flight gauge at that point,
+    as it did behind ``BaseHTTPMiddleware``. No ``Request`` object is built
+    and response bodies pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        method = _HTTP_METHODS.get(method, method)
         if IN_FLIGHT_GAUGE is not None:
             IN_FLIGHT_GAUGE.inc()
+        start_ns = _monotonic_ns()
+        pending = True
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal pending
+            if pending and message["type"] == "http.response.start":
+                pending = False
+                if IN_FLIGHT_GAUGE is not None:
+                    IN_FLIGHT_GAUGE.dec()
+                duration = (_monotonic_ns() - start_ns) * 1e-9
+                _record_request_metrics(method, _endpoint_label(scope), message["status"], duration)
+                headers = message.get("headers")
+                message["headers"] = [*headers, _PROCESSED_BY_HEADER] if headers else [_PROCESSED_BY_HEADER]
+            await send(message)
 
-        start_time = time.perf_counter()
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_metrics)
         except Exception:
-            duration = time.perf_counter() - start_time
-            if REQUEST_COUNTER is not None:
-                REQUEST_COUNTER.labels(method=method, endpoint=path, status=500).inc()
-            if REQUEST_ERRORS is not None:
-                REQUEST_ERRORS.labels(method=method, endpoint=path, status=500).inc()
-            if REQUEST_LATENCY is not None:
-                REQUEST_LATENCY.labels(method=method, endpoint=path).observe(duration)
+            if pending:
+                duration = (_monotonic_ns() - start_ns) * 1e-9
+                _record_request_metrics(method, _endpoint_label(scope), 500, duration)
             raise
         finally:
-            if IN_FLIGHT_GAUGE is not None:
+            if pending and IN_FLIGHT_GAUGE is not None:
                 IN_FLIGHT_GAUGE.dec()
 
-        duration = time.perf_counter() - start_time
 
-        status_code = response.status_code
-        if REQUEST_COUNTER is not None:
-            REQUEST_COUNTER.labels(method=method, endpoint=path, status=status_code).inc()
-        if REQUEST_ERRORS is not None and status_code >= 400:
-            REQUEST_ERRORS.labels(method=method, endpoint=path, status=status_code).inc()
-        if REQUEST_LATENCY is not None:
-            REQUEST_LATENCY.labels(method=method, endpoint=path).observe(duration)
+# Servers decode the request method into a fresh string per request; swapping
+# in one shared object lets binding-cache lookups match on identity.
+_HTTP_METHODS = {
+    method: sys.intern(method) for method in ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+}
+# Status label values are passed as strings, as the exporter stores them.
+_STATUS_STR = {code: str(code) for code in (200, 201, 204, 304, 400, 401, 403, 404, 413, 429, 500, 502, 503)}
+
+
+def _request_bindings(method: str, path: str, status_code: int) -> tuple[Any, Any, Any]:
+    key = (method, path, status_code)
+    bindings = _REQUEST_BINDINGS.get(key)
+    if bindings is None:
+        status_label = _STATUS_STR.get(status_code) or str(status_code)
+        bindings = (
+            REQUEST_COUNTER.labels(method, path, status_label).inc if REQUEST_COUNTER is not None else None,
+            REQUEST_ERRORS.labels(method, path, status_label).inc
+            if REQUEST_ERRORS is not None and status_code >= 400
+            else None,
+            REQUEST_LATENCY.labels(method, path).observe
+            if REQUEST_LATENCY is not None and path not in _UNTIMED_ENDPOINTS
+            else None,
+        )
+        # Endpoint labels are route templates, but keep a hard bound anyway.
+        if len(_REQUEST_BINDINGS) < _LABEL_CACHE_LIMIT:
+            _REQUEST_BINDINGS[key] = bindings
+    return bindings
+
+
+def _record_request_metrics(method: str, path: str, status_code: int, duration: float) -> None:
+    count, count_error, observe = _request_bindings(method, path, status_code)
+    if count is not None:
+        count()
+    if count_error is not None:
+        count_error()
+    if observe is not None:
+        if len(_LATENCY_QUEUE) >= _LATENCY_QUEUE_LIMIT:
+            observe(duration)
+        else:
+            _LATENCY_QUEUE.append((observe, duration))
+            if _latency_drainer is None:
+                _start_latency_drainer()
+    if not next(_REQUEST_SEQUENCE) & _RSS_SAMPLE_MASK:
+        _sample_rss()
+
+
+def _drain_latency_queue() -> None:
+    pop = _LATENCY_QUEUE.popleft
+    while True:
+        try:
+            observe, duration = pop()
+        except IndexError:
+            return
+        observe(duration)
+
+
+def _run_latency_drainer() -> None:
+    while True:
+        time.sleep(_LATENCY_DRAIN_INTERVAL)
+        _drain_latency_queue()
+
+
+def _start_latency_drainer() -> None:
+    global _latency_drainer
+
+    with _latency_drainer_lock:
+        if _latency_drainer is None:
+            _latency_drainer = threading.Thread(
+                target=_run_latency_drainer,
+                name="ai-ticket-latency",
+                daemon=True,
+            )
+            _latency_drainer.start()
 
-        response.headers.setdefault("X-Request-Processed-By", "ai-ticket")
-        return response
+
+def _sample_rss() -> None:
+    if RSS_GAUGE is None or resource is None:
+        return
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT
+    RSS_GAUGE.labels(pid=str(os.getpid())).set(peak)
 
 
 middleware_stack = [
     Middleware(SecurityMiddleware),
     Middleware(MetricsMiddleware),
+    # Starlette leaves text/event-stream uncompressed, so SSE frames are not
+    # held back in the compressor's buffer.
+    Middleware(GZipMiddleware, minimum_size=512, compresslevel=5),
 ]
 
 trust_proxy_count = int(os.environ.get("TRUST_PROXY_COUNT", "0"))
 if trust_proxy_count > 0:
     middleware_stack.append(Middleware(ProxyHeadersMiddleware, trusted_hosts=["*"]))
 
-app = FastAPI(middleware=middleware_stack)
+app = FastAPI(middleware=middleware_stack, default_response_class=ORJSONResponse)
+
+
+@app.on_event("startup")
+async def _handle_startup() -> None:  # pragma: no cover - lifecycle
+    _async_shutdown_event()
+    _install_exit_signal_handlers()
 
 
 @app.on_event("shutdown")
 async def _handle_shutdown() -> None:  # pragma: no cover - lifecycle
-    shutdown_event.set()
+    _mark_shutdown()
+
+
+# Fixed error payloads are serialised once at import time.
+_INVALID_REQUEST_BODY = _orjson_dumps({"error": "invalid_request", "details": "Request must be JSON."})
+_INTERNAL_ERROR_BODY = _orjson_dumps({"error": "internal_error", "details": "An unexpected error occurred."})
+_LOGGED_KEY_LIMIT = 16
+_PAYLOAD_TOO_LARGE_BODY = _orjson_dumps({"error": "payload_too_large", "details": "Request body is too large."})
+
+
+def _payload_too_large() -> Response:
+    logger.error("Request body exceeds MAX_BODY_BYTES", extra={"max_body_bytes": MAX_BODY_BYTES})
+    metrics_store.record_event(
+        latency_s=0.0,
+        success=False,
+        error_code="payload_too_large",
+        message="Request body is too large.",
+    )
+    # Spelled numerically: Starlette renamed the 413 constant across releases.
+    return _json_response(_PAYLOAD_TOO_LARGE_BODY, 413)
+
+
+async def _read_capped_body(request: Request) -> bytes | None:
+    """Return the request body, or ``None`` once it grows past ``MAX_BODY_BYTES``."""
+
+    chunks: list[bytes] = []
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > MAX_BODY_BYTES:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
 
 
 @app.post("/event")
-async def handle_event(request: Request) -> JSONResponse:
+async def handle_event(request: Request) -> Response:
     content_type = request.headers.get("content-type", "").lower()
     if "application/json" not in content_type:
         logger.error("Request is not JSON")
@@ -497,14 +931,21 @@ async def handle_event(request: Request) -> JSONResponse:
             error_code="invalid_request",
             message="Request must be JSON.",
         )
-        return JSONResponse(
-            {"error": "invalid_request", "details": "Request must be JSON."},
-            status_code=status.HTTP_400_BAD_REQUEST,
-        )
+        return _json_response(_INVALID_REQUEST_BODY, status.HTTP_400_BAD_REQUEST)
+
+    # Reject declared oversize bodies before reading them; chunked uploads
+    # without a length are cut off as soon as they pass the cap.
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > MAX_BODY_BYTES:
+        return _payload_too_large()
+
+    raw_body = await _read_capped_body(request)
+    if raw_body is None:
+        return _payload_too_large()
 
     try:
-        event_data = await request.json()
-    except json.JSONDecodeError:
+        event_data = _orjson_loads(raw_body)
+    except (orjson.JSONDecodeError, UnicodeDecodeError):
         logger.error("Malformed JSON payload")
         metrics_store.record_event(
             latency_s=0.0,
@@ -512,25 +953,25 @@ async def handle_event(request: Request) -> JSONResponse:
             error_code="invalid_request",
             message="Request must be JSON.",
         )
-        return JSONResponse(
-            {"error": "invalid_request", "details": "Request must be JSON."},
-            status_code=status.HTTP_400_BAD_REQUEST,
-        )
+        return _json_response(_INVALID_REQUEST_BODY, status.HTTP_400_BAD_REQUEST)
 
-    logger.info(
-        "Received event data",
-        extra={"keys": list(event_data.keys()) if isinstance(event_data, Mapping) else None},
-    )
+    if logger.isEnabledFor(logging.INFO):
+        # Cap the logged keys so a hostile payload cannot bloat the log record.
+        if isinstance(event_data, Mapping):
+            keys, key_count = list(islice(event_data, _LOGGED_KEY_LIMIT)), len(event_data)
+        else:
+            keys, key_count = None, 0
+        logger.info("Received event data", extra={"keys": keys, "key_count": key_count})
 
-    start = perf_counter()
+    start_ns = _monotonic_ns()
 
-    if bool(getattr(event_data, "get", lambda *_: False)("stream")):
-        return _handle_streaming_event(event_data, start=start)
+    if isinstance(event_data, Mapping) and event_data.get("stream"):
+        return await _handle_streaming_event(event_data, start_ns=start_ns, body_size=len(raw_body))
 
     try:
         response = await anyio.to_thread.run_sync(on_event, event_data)
     except Exception as error:  # pragma: no cover - defensive guard
-        duration = perf_counter() - start
+        duration = (_monotonic_ns() - start_ns) * 1e-9
         logger.exception("Unhandled exception processing event")
         metrics_store.record_event(
             latency_s=duration,
@@ -538,21 +979,19 @@ async def handle_event(request: Request) -> JSONResponse:
             error_code="unhandled_exception",
             message=str(error),
         )
-        return JSONResponse(
-            {"error": "internal_error", "details": "An unexpected error occurred."},
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+        return _json_response(_INTERNAL_ERROR_BODY, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    duration = perf_counter() - start
+    duration = (_monotonic_ns() - start_ns) * 1e-9
 
+    # Response dataclasses are handed to orjson as-is; it walks their fields
+    # natively, so no intermediate dict is built.
     if isinstance(response, CompletionResponse):
-        payload = asdict(response)
-        logger.info("Successfully processed event", extra={"response_keys": list(payload.keys())})
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Successfully processed event", extra={"response_keys": _COMPLETION_RESPONSE_KEYS})
         metrics_store.record_event(latency_s=duration, success=True)
-        return JSONResponse(payload, status_code=status.HTTP_200_OK)
+        return _json_response(response, status.HTTP_200_OK)
 
     if isinstance(response, ErrorResponse):
-        payload = asdict(response)
         logger.error(
             "Error processing event",
             extra={"error_code": response.error, "status_code": response.status_code},
@@ -563,10 +1002,13 @@ async def handle_event(request: Request) -> JSONResponse:
             error_code=response.error,
             message=response.message,
         )
-        return JSONResponse(payload, status_code=response.status_code)
+        return _json_response(response, response.status_code)
 
     payload = _normalise_response(response)
-    status_code = payload.pop("status_code", status.HTTP_200_OK)
+    status_code = payload.get("status_code", status.HTTP_200_OK)
+    if "status_code" in payload:
+        # The payload may be the handler's own dict; strip the key from a copy.
+        payload = {key: value for key, value in payload.items() if key != "status_code"}
     if payload.get("error"):
         logger.error("Processing event returned legacy error", extra={"payload": payload})
         metrics_store.record_event(
@@ -577,32 +1019,75 @@ async def handle_event(request: Request) -> JSONResponse:
         )
     else:
         metrics_store.record_event(latency_s=duration, success=True)
-    return JSONResponse(payload, status_code=status_code)
+    return _json_response(payload, status_code)
+
+
+# Indexed by ``_SHUTDOWN_FLAG[0]``; probes get a prebuilt body instead of a
+# fresh serialisation.
+_HEALTH_BODIES = (
+    _orjson_dumps({"status": "healthy", "shutdown_initiated": False}),
+    _orjson_dumps({"status": "healthy", "shutdown_initiated": True}),
+)
 
 
 @app.get("/health")
-async def health_check() -> JSONResponse:
-    return JSONResponse({"status": "healthy", "shutdown_initiated": shutdown_event.is_set()})
+async def health_check() -> Response:
+    return Response(content=_HEALTH_BODIES[_SHUTDOWN_FLAG[0]], media_type="application/json")
+
+
+async def _metrics_exposition() -> AsyncGenerator[bytes, None]:
+    _drain_latency_queue()
+    for chunk in generate_latest_iter():
+        yield chunk
 
 
 @app.get("/metrics")
-async def metrics() -> Response:
-    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+async def metrics() -> StreamingResponse:
+    # Families are rendered and written one at a time, so the scrape never
+    # holds the whole exposition in memory. An async generator keeps the
+    # iteration on the event loop instead of a threadpool hop per chunk.
+    return StreamingResponse(_metrics_exposition(), media_type=CONTENT_TYPE_LATEST)
 
 
 @app.get("/api/metrics/summary")
-async def metrics_summary() -> JSONResponse:
-    return JSONResponse(metrics_store.snapshot())
+async def metrics_summary() -> Response:
+    return _json_response(metrics_store.snapshot())
 
 
-async def _metrics_event_stream() -> AsyncGenerator[str, None]:
-    queue = metrics_store.subscribe()
+def _latest_snapshot(queue: asyncio.Queue[dict], snapshot: dict) -> dict:
+    """Drop snapshots already superseded by newer ones waiting in ``queue``.
+
+    Each snapshot carries the full dashboard state, so a client that fell
+    behind only needs the most recent one rather than every intermediate frame.
+    """
+
+    while not queue.empty():
+        snapshot = queue.get_nowait()
+    return snapshot
+
+
+async def _metrics_event_stream() -> AsyncGenerator[bytes, None]:
+    queue = metrics_store.subscribe_async()
+    # One shutdown waiter per connection, raced against each queue read so
+    # open dashboards end their stream instead of holding up shutdown.
+    shutdown_wait = asyncio.ensure_future(_async_shutdown_event().wait())
+    next_payload: asyncio.Future[dict] | None = None
     try:
-        yield f"data: {metrics_store.snapshot_json()}\n\n"
+        yield _sse_frame(metrics_store.snapshot())
         while True:
-            payload = await anyio.to_thread.run_sync(queue.get)
-            yield f"data: {json.dumps(payload)}\n\n"
+            next_payload = asyncio.ensure_future(queue.get())
+            await asyncio.wait((next_payload, shutdown_wait), return_when=asyncio.FIRST_COMPLETED)
+            if next_payload.done():
+                yield _sse_frame(_latest_snapshot(queue, next_payload.result()))
+                continue
+            next_payload.cancel()
+            yield _SHUTDOWN_FRAME
+            return
     finally:
+        # A disconnect can cancel us mid-wait; neither read may outlive the stream.
+        shutdown_wait.cancel()
+        if next_payload is not None:
+            next_payload.cancel()
         metrics_store.unsubscribe(queue)
 
 
@@ -611,33 +1096,123 @@ async def metrics_stream() -> StreamingResponse:
     return StreamingResponse(_metrics_event_stream(), media_type="text/event-stream")
 
 
-def _resolve_dashboard_asset(asset_path: str | None) -> Path:
-    if not UI_DIST_PATH.exists():
+# Dashboard file names carry no content hash, so assets get a bounded max-age
+# and the SPA shell is always revalidated.
+_UI_ASSET_CACHE_CONTROL = "public, max-age=3600"
+_UI_INDEX_CACHE_CONTROL = "no-cache"
+# Files up to this size are held in memory with a content ETag after their
+# first request, re-read and re-hashed whenever the file's mtime or size
+# changes; larger ones are streamed from disk each time.
+_UI_CACHED_ASSET_BYTES = 1 << 20
+# (dist root, ((directory, mtime_ns), ...), relative POSIX path -> file,
+# file -> (mtime_ns, size, body, etag, media type)). The index is rebuilt when
+# any directory in the bundle changes; cached bodies are checked against
+# their own file's stat, so in-place rewrites are picked up on the next request.
+_DashboardBody = tuple[int, int, bytes, str, str]
+_ui_asset_index: tuple[Path, tuple[tuple[Path, int], ...], dict[str, Path], dict[Path, _DashboardBody]] | None = None
+
+
+def _dashboard_index() -> tuple[dict[str, Path], dict[Path, _DashboardBody]]:
+    global _ui_asset_index
+
+    cached = _ui_asset_index
+    if cached is not None and cached[0] == UI_DIST_PATH:
+        try:
+            if all(directory.stat().st_mtime_ns == mtime_ns for directory, mtime_ns in cached[1]):
+                return cached[2], cached[3]
+        except OSError:
+            pass
+
+    directories: list[tuple[Path, int]] = []
+    assets: dict[str, Path] = {}
+    try:
+        directories.append((UI_DIST_PATH, UI_DIST_PATH.stat().st_mtime_ns))
+        for path in UI_DIST_PATH.rglob("*"):
+            if path.is_dir():
+                directories.append((path, path.stat().st_mtime_ns))
+            elif path.is_file():
+                assets[path.relative_to(UI_DIST_PATH).as_posix()] = path
+    except OSError:
+        return {}, {}
+    bodies = cached[3] if cached is not None and cached[0] == UI_DIST_PATH else {}
+    _ui_asset_index = (UI_DIST_PATH, tuple(directories), assets, bodies)
+    return assets, bodies
+
+
+def _cached_dashboard_asset(
+    bodies: dict[Path, _DashboardBody], path: Path
+) -> tuple[bytes, str, str] | None:
+    """Return ``(body, etag, media type)`` for ``path`` if it is small enough to cache."""
+
+    try:
+        stat = path.stat()
+    except OSError:
+        bodies.pop(path, None)
+        return None
+    entry = bodies.get(path)
+    if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+        if stat.st_size > _UI_CACHED_ASSET_BYTES:
+            bodies.pop(path, None)
+            return None
+        try:
+            body = path.read_bytes()
+        except OSError:
+            return None
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        entry = bodies[path] = (stat.st_mtime_ns, stat.st_size, body, etag, media_type)
+    return entry[2], entry[3], entry[4]
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    return if_none_match.strip() == "*" or any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    )
+
+
+def _resolve_dashboard_asset(assets: dict[str, Path], asset_path: str | None) -> Path:
+    if not assets:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Dashboard assets are not available. Build the UI bundle first.",
         )
 
     if asset_path:
-        resolved_path = UI_DIST_PATH / asset_path
-        if resolved_path.exists() and resolved_path.is_file():
+        resolved_path = assets.get(asset_path)
+        if resolved_path is not None:
             return resolved_path
 
-    index_path = UI_DIST_PATH / "index.html"
-    if not index_path.exists():
+    index_path = assets.get("index.html")
+    if index_path is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dashboard index not found.")
     return index_path
 
 
 @app.get("/dashboard")
 @app.get("/dashboard/{asset_path:path}")
-async def dashboard(asset_path: str | None = None) -> FileResponse:
-    resolved_path = _resolve_dashboard_asset(asset_path)
-    return FileResponse(resolved_path)
+async def dashboard(request: Request, asset_path: str | None = None) -> Response:
+    assets, bodies = _dashboard_index()
+    resolved_path = _resolve_dashboard_asset(assets, asset_path)
+    cache_control = _UI_INDEX_CACHE_CONTROL if resolved_path.name == "index.html" else _UI_ASSET_CACHE_CONTROL
+    cached = _cached_dashboard_asset(bodies, resolved_path)
+    if cached is None:
+        return FileResponse(resolved_path, headers={"Cache-Control": cache_control})
+
+    body, etag, media_type = cached
+    headers = {"Cache-Control": cache_control, "ETag": etag}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
 
 
 if __name__ == "__main__":  # pragma: no cover
-    import uvicorn
-
-    port = int(os.environ.get("PORT", "5000"))
-    uvicorn.run("ai_ticket.server:app", host="0.0.0.0", port=port, reload=False)
+    from ai_ticket.cli import main as cli_main
+
+    # Delegate to ``ai-ticket serve`` so ``python -m ai_ticket.server`` gets the
+    # same multi-worker Uvicorn setup as the CLI and the container image.
+    serve_args = ["serve", "--port", os.environ.get("PORT", "5000")]
+    web_concurrency = os.environ.get("WEB_CONCURRENCY")
+    if web_concurrency:
+        serve_args += ["--workers", web_concurrency]
+    sys.exit(cli_main(serve_args))
@@ -1,9 +1,11 @@
 """Frontend assets for the AI Ticket dashboard."""
 
+from functools import lru_cache
 from importlib.resources import files
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_ui_dist_path() -> Path:
     """Return the path to the built UI distribution assets."""
     return Path(files(__package__) / "dist")
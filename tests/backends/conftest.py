@@ -3,11 +3,19 @@ from __future__ import annotations
 import pytest
 
 from ai_ticket._compat import anyio
+from ai_ticket.backends import kobold_client
 from ai_ticket.backends.kobold_client import aclose_all_kobold_pipelines
 
 
+def _close_pipelines() -> None:
+    # Spinning up an event loop just to close nothing is most of this
+    # fixture's cost, so only do it when a test actually built a pipeline.
+    if kobold_client._PIPELINES._pipelines:
+        anyio.run(aclose_all_kobold_pipelines)
+
+
 @pytest.fixture(autouse=True)
 def _reset_kobold_pipelines() -> None:
-    anyio.run(aclose_all_kobold_pipelines)
+    _close_pipelines()
     yield
-    anyio.run(aclose_all_kobold_pipelines)
+    _close_pipelines()
@@ -37,3 +37,21 @@ def test_extract_prompt_invalid_content_raises():
         extract_prompt({"messages": []})
 
     assert exc_info.value.code == "prompt_extraction_failed"
+
+
+def test_extract_prompt_only_parses_text_that_can_be_json(monkeypatch):
+    from ai_ticket.events import prompt_extraction
+
+    parsed: list[str] = []
+    original_loads = json.loads
+
+    def recording_loads(text, *args, **kwargs):
+        parsed.append(text)
+        return original_loads(text, *args, **kwargs)
+
+    monkeypatch.setattr(prompt_extraction.json, "loads", recording_loads)
+
+    assert extract_prompt("Hello there").prompt == "Hello there"
+    assert extract_prompt("  42 apples").prompt == "  42 apples"
+    assert extract_prompt('\n"quoted"').prompt == "quoted"
+    assert parsed == ["  42 apples", '\n"quoted"']
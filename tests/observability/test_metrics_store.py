@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from ai_ticket.observability.metrics import MetricsStore
+
+
+def test_record_event_is_aggregated_off_the_calling_thread() -> None:
+    store = MetricsStore()
+    applied_on: list[str] = []
+    published = threading.Event()
+    original = store._apply_pending_locked
+
+    def _tracking_apply() -> bool:
+        applied = original()
+        if applied:
+            applied_on.append(threading.current_thread().name)
+            published.set()
+        return applied
+
+    store._apply_pending_locked = _tracking_apply  # type: ignore[method-assign]
+    store.record_event(latency_s=0.01, success=True)
+
+    assert published.wait(1.0)
+    assert applied_on == ["ai-ticket-metrics"]
+    assert store.snapshot()["totals"]["requests"] == 1
+    store.close()
+    assert not store._aggregator.is_alive()
+
+
+def test_snapshot_includes_events_not_yet_aggregated() -> None:
+    store = MetricsStore()
+    store._aggregator = threading.current_thread()  # keep the worker from starting
+
+    for _ in range(3):
+        store.record_event(latency_s=0.02, success=False, error_code="backend_error", message="offline")
+
+    assert len(store._pending) == 3
+    snapshot = store.snapshot()
+    assert snapshot["totals"] == {"requests": 3, "successes": 0, "errors": 3}
+    assert [error["code"] for error in snapshot["recentErrors"]] == ["backend_error"] * 3
+    assert not store._pending
+
+
+def test_full_backlog_counts_and_reports_dropped_events(monkeypatch, caplog) -> None:
+    monkeypatch.setattr(MetricsStore, "_PENDING_LIMIT", 3)
+    store = MetricsStore()
+    store._aggregator = threading.current_thread()  # keep the worker from starting
+
+    for _ in range(5):
+        store.record_event(latency_s=0.01, success=True)
+
+    assert store.dropped_events == 2
+    with caplog.at_level("WARNING", logger="ai_ticket.observability.metrics"):
+        assert store.snapshot()["totals"]["requests"] == 3
+    assert "dropped 2 events" in caplog.text
+
+
+def test_sparkline_buckets_by_event_time_not_batch(monkeypatch) -> None:
+    from ai_ticket.observability import metrics as metrics_module
+
+    clock = [1_000.0]
+    monkeypatch.setattr(metrics_module.time, "time", lambda: clock[0])
+    batched, eager = MetricsStore(), MetricsStore()
+    for store in (batched, eager):
+        store._aggregator = threading.current_thread()
+
+    for offset in (1.0, 2.0, 3.0, 61.0, 185.0):
+        clock[0] = 1_000.0 + offset
+        for store in (batched, eager):
+            store.record_event(latency_s=0.01, success=True)
+        eager.flush()
+    batched.flush()
+
+    assert list(batched._sparkline) == list(eager._sparkline)
+    # Buckets are minutes counted from the store's creation: three events in
+    # the first, one in the second, none in the third and one in the fourth.
+    assert list(batched._sparkline)[-4:] == [3.0, 1.0, 0.0, 1.0]
+
+    clock[0] += 120.0
+    assert batched.snapshot()["sparkline"][-3:] == pytest.approx([1 / 3, 0.1, 0.1])
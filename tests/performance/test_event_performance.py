@@ -1,19 +1,20 @@
 from __future__ import annotations
 
 import time
-from concurrent.futures import ThreadPoolExecutor
 from statistics import mean
 
+import anyio
 import pytest
+from httpx import ASGITransport, AsyncClient
 
-from ai_ticket._compat import httpx
 from ai_ticket.events.inference import KoboldCompletionResult
 from ai_ticket.observability.metrics import MetricsStore
-from ai_ticket.server import app as flask_app
+from ai_ticket.server import app
 
 
 @pytest.mark.performance
-def test_event_endpoint_meets_latency_and_throughput(monkeypatch) -> None:
+@pytest.mark.anyio
+async def test_event_endpoint_meets_latency_and_throughput(monkeypatch) -> None:
     request_count = 24
     max_workers = 6
 
@@ -31,20 +32,23 @@ def test_event_endpoint_meets_latency_and_throughput(monkeypatch) -> None:
 
     payload = {"content": {"prompt": "Load test prompt"}}
 
-    def _exercise(_: int) -> float:
-        transport = httpx.WSGITransport(app=flask_app)
-        with httpx.Client(transport=transport, base_url="http://testserver") as client:
+    durations: list[float] = []
+    limiter = anyio.CapacityLimiter(max_workers)
+
+    async def _exercise(client: AsyncClient) -> None:
+        async with limiter:
             start = time.perf_counter()
-            response = client.post("/event", json=payload)
+            response = await client.post("/event", json=payload)
             elapsed = time.perf_counter() - start
-            assert response.status_code == 200
-            assert response.json()["completion"] == "stubbed"
-            return elapsed
-
-    durations: list[float] = []
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        for duration in executor.map(_exercise, range(request_count)):
-            durations.append(duration)
+        assert response.status_code == 200
+        assert response.json()["completion"] == "stubbed"
+        durations.append(elapsed)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        async with anyio.create_task_group() as task_group:
+            for _ in range(request_count):
+                task_group.start_soon(_exercise, client)
 
     snapshot = metrics_probe.snapshot()
 
@@ -0,0 +1,48 @@
+import time
+
+import pytest
+
+from ai_ticket.security import InMemoryRateLimiter, rate_limit
+
+
+def test_in_memory_rate_limiter_enforces_limits_per_key():
+    limiter = InMemoryRateLimiter(limit=2, window_seconds=60)
+
+    assert limiter.allow("client-a")[0]
+    assert limiter.allow("client-a")[0]
+    allowed, retry_after = limiter.allow("client-a")
+    assert not allowed
+    assert retry_after is not None and 0 < retry_after <= 60
+
+    assert limiter.allow("client-b")[0]
+
+
+def test_in_memory_rate_limiter_sweeps_idle_keys():
+    limiter = InMemoryRateLimiter(limit=5, window_seconds=0.01)
+    limiter._SWEEP_EVERY = 1
+    for index in range(200):
+        limiter.allow(f"client-{index}")
+    time.sleep(0.03)
+
+    for index in range(2000):
+        limiter.allow(f"probe-{index}")
+
+    remaining = {key for shard in limiter._shards for key in shard}
+    assert not any(key.startswith("client-") for key in remaining)
+
+
+def test_in_memory_rate_limiter_weights_previous_window(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(rate_limit, "_monotonic", lambda: clock[0])
+    limiter = InMemoryRateLimiter(limit=4, window_seconds=10)
+
+    for _ in range(4):
+        assert limiter.allow("client")[0]
+    assert not limiter.allow("client")[0]
+
+    # Two seconds into the next window 80% of the previous count still applies.
+    clock[0] = 112.0
+    assert limiter.allow("client")[0]
+    allowed, retry_after = limiter.allow("client")
+    assert not allowed
+    assert retry_after == pytest.approx(0.5)
@@ -1,3 +1,5 @@
+import sqlite3
+import threading
 import time
 
 from ai_ticket.security import SQLiteRateLimiter
@@ -20,3 +22,106 @@ def test_sqlite_rate_limiter_enforces_limits_across_instances(tmp_path):
 
     limiter_one.close()
     limiter_two.close()
+
+
+def test_sqlite_rate_limiter_is_atomic_across_threads(tmp_path):
+    limiter = SQLiteRateLimiter(tmp_path / "rate.db", limit=10, window_seconds=60)
+    results: list[bool] = []
+    results_lock = threading.Lock()
+
+    def worker() -> None:
+        for _ in range(5):
+            allowed, _ = limiter.allow("client")
+            with results_lock:
+                results.append(allowed)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(True) == 10
+    assert len(results) == 40
+
+    limiter.close()
+
+
+def test_sqlite_rate_limiter_honours_rows_written_by_another_process(tmp_path):
+    db_path = tmp_path / "rate.db"
+    limiter = SQLiteRateLimiter(db_path, limit=1, window_seconds=60)
+    limiter.close()
+
+    connection = sqlite3.connect(db_path)
+    with connection:
+        connection.execute(
+            "INSERT INTO rate_limit_events(key, timestamp) VALUES (?, ?)",
+            ("client", time.time()),
+        )
+    connection.close()
+
+    limiter = SQLiteRateLimiter(db_path, limit=1, window_seconds=60)
+    allowed, retry_after = limiter.allow("client")
+    limiter.close()
+
+    assert not allowed
+    assert 59 < retry_after <= 60
+
+
+def test_sqlite_rate_limiter_sweeps_expired_rows_in_background(tmp_path):
+    db_path = tmp_path / "rate.db"
+    limiter = SQLiteRateLimiter(db_path, limit=5, window_seconds=0.05, cleanup_interval=0.05)
+    assert limiter.allow("client")[0]
+
+    deadline = time.monotonic() + 2
+    remaining = 1
+    while remaining and time.monotonic() < deadline:
+        time.sleep(0.05)
+        connection = sqlite3.connect(db_path)
+        (remaining,) = connection.execute("SELECT COUNT(*) FROM rate_limit_events").fetchone()
+        connection.close()
+
+    limiter.close()
+    assert remaining == 0
+    assert not limiter._cleanup_thread.is_alive()
+
+
+def test_sqlite_rate_limiter_ignores_expired_rows_before_sweep(tmp_path):
+    db_path = tmp_path / "rate.db"
+    limiter = SQLiteRateLimiter(db_path, limit=1, window_seconds=0.05, cleanup_interval=60)
+    assert limiter.allow("client")[0]
+    time.sleep(0.06)
+    assert limiter.allow("client")[0]
+
+    connection = sqlite3.connect(db_path)
+    (rows,) = connection.execute("SELECT COUNT(*) FROM rate_limit_events").fetchone()
+    indexes = {row[1] for row in connection.execute("PRAGMA index_list(rate_limit_events)")}
+    connection.close()
+    limiter.close()
+
+    assert rows == 2
+    assert "idx_rate_limit_key_timestamp" in indexes
+    assert "idx_rate_limit_key" not in indexes
+
+
+def test_sqlite_rate_limiter_does_not_open_connections_per_thread(tmp_path, monkeypatch):
+    from ai_ticket.security import rate_limit
+
+    opened: list[sqlite3.Connection] = []
+    connect = sqlite3.connect
+
+    def counting_connect(*args, **kwargs):
+        connection = connect(*args, **kwargs)
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(rate_limit.sqlite3, "connect", counting_connect)
+    limiter = SQLiteRateLimiter(tmp_path / "rate.db", limit=100, window_seconds=60)
+
+    for _ in range(5):
+        thread = threading.Thread(target=limiter.allow, args=("client",))
+        thread.start()
+        thread.join()
+
+    limiter.close()
+    assert len(opened) == 2
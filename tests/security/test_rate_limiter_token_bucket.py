@@ -0,0 +1,37 @@
+import pytest
+
+from ai_ticket.security import TokenBucketRateLimiter, rate_limit
+
+
+def test_token_bucket_rate_limiter_refills_over_time(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(rate_limit, "_monotonic", lambda: clock[0])
+    limiter = TokenBucketRateLimiter(limit=4, window_seconds=10)
+
+    for _ in range(4):
+        assert limiter.allow("client")[0]
+    allowed, retry_after = limiter.allow("client")
+    assert not allowed
+    assert retry_after == pytest.approx(2.5)
+    assert limiter.allow("other")[0]
+
+    # One token accrues every 2.5 seconds.
+    clock[0] = 102.5
+    assert limiter.allow("client")[0]
+    assert not limiter.allow("client")[0]
+
+
+def test_token_bucket_rate_limiter_sweeps_refilled_buckets(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(rate_limit, "_monotonic", lambda: clock[0])
+    limiter = TokenBucketRateLimiter(limit=5, window_seconds=1)
+    limiter._SWEEP_EVERY = 1
+    for index in range(200):
+        limiter.allow(f"client-{index}")
+
+    clock[0] = 102.0
+    for index in range(2000):
+        limiter.allow(f"probe-{index}")
+
+    remaining = {key for shard in limiter._shards for key in shard}
+    assert not any(key.startswith("client-") for key in remaining)
@@ -39,3 +39,71 @@ def test_token_manager_update_tokens(monkeypatch):
     manager = TokenManager(env_var="UNUSED", file_env_var="UNUSED_FILE", reload_interval=1)
     manager.update_tokens({"dynamic-token"})
     assert manager.is_valid("dynamic-token")
+
+
+def test_token_manager_stores_only_digests(monkeypatch):
+    manager = TokenManager(env_var="UNUSED", file_env_var="UNUSED_FILE", reload_interval=1)
+    manager.update_tokens({"dynamic-token"})
+    assert "dynamic-token" not in manager.tokens
+    assert all(isinstance(token, bytes) and len(token) == 32 for token in manager.tokens)
+
+
+def test_token_manager_reuses_parsed_file_until_it_changes(monkeypatch, tmp_path):
+    file_var = "CACHED_TOKEN_FILE"
+    token_file = tmp_path / "tokens.txt"
+    token_file.write_text("file-token\n")
+    monkeypatch.setenv(file_var, str(token_file))
+    manager = TokenManager(env_var="UNUSED", file_env_var=file_var, reload_interval=1)
+
+    reads = []
+    original_read_text = type(token_file).read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(token_file), "read_text", counting_read_text)
+
+    manager.reload(force=True)
+    assert reads == []
+    assert manager.is_valid("file-token")
+
+    token_file.write_text("rotated-token-with-new-size\n")
+    manager.reload(force=True)
+    assert len(reads) == 1
+    assert manager.is_valid("rotated-token-with-new-size")
+
+
+def test_token_manager_skips_source_reads_within_interval(monkeypatch):
+    env_var = "INTERVAL_TOKEN_ENV"
+    monkeypatch.setenv(env_var, "first-token")
+    manager = TokenManager(env_var=env_var, file_env_var="UNUSED_FILE", reload_interval=60)
+    monkeypatch.setenv(env_var, "second-token")
+
+    assert manager.is_valid("first-token")
+    assert not manager.is_valid("second-token")
+
+    manager.reload(force=True)
+    assert manager.is_valid("second-token")
+
+
+def test_token_manager_revokes_file_tokens_within_interval(monkeypatch, tmp_path):
+    token_file = tmp_path / "tokens.txt"
+    token_file.write_text("revoked-token\nkept-token\n")
+    monkeypatch.setenv("REVOKE_TOKEN_FILE", str(token_file))
+    manager = TokenManager(env_var="UNUSED", file_env_var="REVOKE_TOKEN_FILE", reload_interval=60)
+    assert manager.is_valid("revoked-token")
+
+    token_file.write_text("kept-token\n")
+
+    assert not manager.is_valid("revoked-token")
+    assert manager.is_valid("kept-token")
+
+
+def test_token_manager_trims_env_tokens(monkeypatch):
+    monkeypatch.setenv("PADDED_TOKEN_ENV", " first , ,second token,\tthird,, ")
+    manager = TokenManager(env_var="PADDED_TOKEN_ENV", file_env_var="UNUSED_FILE", reload_interval=1)
+
+    for token in ("first", "second token", "third"):
+        assert manager.is_valid(token)
+    assert len(manager.tokens) == 3
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from ai_ticket._compat import _anyio_stub
+from ai_ticket.backends import pipeline as pipeline_module
+from ai_ticket.backends.base import BackendContext, CompletionRequest, CompletionResult, HedgedRequest
+from ai_ticket.backends.pipeline import BackendPipeline, BackendSlotConfig
+
+
+def test_task_group_cancel_scope_reaches_running_tasks() -> None:
+    cancelled: list[int] = []
+
+    async def sleeper(index: int) -> None:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+
+    async def run() -> None:
+        async with _anyio_stub.create_task_group() as tg:
+            for index in range(3):
+                tg.start_soon(sleeper, index)
+            await asyncio.sleep(0.01)
+            tg.cancel_scope.cancel()
+
+    started = time.perf_counter()
+    asyncio.run(run())
+
+    assert time.perf_counter() - started < 0.5
+    assert sorted(cancelled) == [0, 1, 2]
+
+
+def test_fallback_hedging_cancels_losing_attempts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pipeline_module, "anyio", _anyio_stub)
+
+    class _HedgedBackend:
+        name = "hedged"
+
+        def __init__(self) -> None:
+            self.calls = 0
+            self.cancelled = 0
+
+        async def acomplete(
+            self,
+            request: CompletionRequest,
+            *,
+            context: BackendContext | None = None,
+        ) -> CompletionResult:
+            del request, context
+            call_index = self.calls
+            self.calls += 1
+            if call_index == 0:
+                await asyncio.sleep(0.05)
+                return CompletionResult(completion="fast")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+            return CompletionResult(error="slow")
+
+    backend = _HedgedBackend()
+    pipeline = BackendPipeline(
+        [
+            BackendSlotConfig(
+                backend=backend,
+                concurrency=3,
+                hedging=HedgedRequest(hedges=2, hedge_delay=0.001),
+            )
+        ]
+    )
+
+    async def run() -> CompletionResult:
+        try:
+            return await pipeline.acomplete(CompletionRequest(prompt="hedge"))
+        finally:
+            await pipeline.aclose()
+
+    started = time.perf_counter()
+    result = asyncio.run(run())
+
+    assert result.completion == "fast"
+    assert time.perf_counter() - started < 0.5
+    assert backend.calls == 3
+    assert backend.cancelled == 2
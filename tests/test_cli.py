@@ -19,6 +19,8 @@ def _make_args(**overrides: object) -> argparse.Namespace:
         "keepalive": 5,
         "limit_concurrency": 1000,
         "backlog": 2048,
+        "loop": "uvloop",
+        "http": "httptools",
     }
     defaults.update(overrides)
     return argparse.Namespace(**defaults)
@@ -57,6 +59,8 @@ def test_serve_command_runs_uvicorn_by_default(mocker, cli_context) -> None:
     assert options["limit_concurrency"] == 1000
     assert options["backlog"] == 2048
     assert options["reload"] is False
+    assert options["loop"] == "uvloop"
+    assert options["http"] == "httptools"
     mock_print.assert_called_once()
 
 
@@ -76,6 +80,15 @@ def test_serve_command_enables_reload(mocker, cli_context) -> None:
     mock_print.assert_called_once()
 
 
+def test_serve_parser_falls_back_without_speedups(mocker) -> None:
+    mocker.patch("ai_ticket.cli.find_spec", return_value=None)
+
+    args = cli.build_parser().parse_args(["serve"])
+
+    assert args.loop == "asyncio"
+    assert args.http == "h11"
+
+
 def test_serve_command_reports_missing_uvicorn(mocker, cli_context) -> None:
     mocker.patch("ai_ticket.cli._print_panel")
     mocker.patch("ai_ticket.cli._run_with_uvicorn", side_effect=ImportError("uvicorn"))
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from ai_ticket._compat import fastapi as compat
+
+
+class _PassThrough(compat.BaseHTTPMiddleware):
+    async def dispatch(self, request: compat.Request, call_next: compat.RequestResponseEndpoint) -> compat.Response:
+        response = await call_next(request)
+        response.headers["x-middleware"] = "1"
+        return response
+
+
+def _http_scope(path: str) -> dict[str, Any]:
+    return {"type": "http", "method": "GET", "path": path, "headers": [], "client": ("127.0.0.1", 1234)}
+
+
+def test_middleware_relays_streamed_chunks_as_they_are_sent() -> None:
+    release = asyncio.Event()
+    app = compat.FastAPI(middleware=[compat.Middleware(_PassThrough)])
+
+    async def chunks():
+        yield b"first"
+        await release.wait()
+        yield b"second"
+
+    @app.get("/stream")
+    async def stream() -> compat.StreamingResponse:
+        return compat.StreamingResponse(chunks(), media_type="text/event-stream")
+
+    async def run() -> list[dict[str, Any]]:
+        sent: list[dict[str, Any]] = []
+        first_chunk = asyncio.Event()
+
+        async def receive() -> dict[str, Any]:
+            await asyncio.Event().wait()
+            return {}
+
+        async def send(message: dict[str, Any]) -> None:
+            sent.append(message)
+            if message.get("body") == b"first":
+                first_chunk.set()
+
+        serving = asyncio.ensure_future(app(_http_scope("/stream"), receive, send))
+        await asyncio.wait_for(first_chunk.wait(), timeout=1)
+        assert not serving.done()
+        release.set()
+        await asyncio.wait_for(serving, timeout=1)
+        return sent
+
+    sent = asyncio.run(run())
+
+    assert sent[0]["type"] == "http.response.start"
+    assert (b"x-middleware", b"1") in sent[0]["headers"]
+    assert [message.get("body") for message in sent[1:]] == [b"first", b"second", b""]
+    assert sent[-1]["more_body"] is False
+
+
+def test_middleware_stops_downstream_app_when_sending_fails() -> None:
+    ticks: list[int] = []
+    app = compat.FastAPI(middleware=[compat.Middleware(_PassThrough)])
+
+    async def chunks():
+        while True:
+            ticks.append(len(ticks))
+            yield b"tick"
+
+    @app.get("/stream")
+    async def stream() -> compat.StreamingResponse:
+        return compat.StreamingResponse(chunks())
+
+    async def run() -> int:
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: dict[str, Any]) -> None:
+            if message.get("body"):
+                raise ConnectionResetError
+
+        try:
+            await app(_http_scope("/stream"), receive, send)
+        except ConnectionResetError:
+            pass
+        produced = len(ticks)
+        await asyncio.sleep(0.05)
+        return produced
+
+    produced = asyncio.run(run())
+
+    assert len(ticks) == produced
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from collections.abc import Iterator
+
+import pytest
+
+from ai_ticket._compat import _httpx_stub
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        payload = json.dumps({"echo": json.loads(body)}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_: object) -> None:
+        pass
+
+
+@pytest.fixture
+def echo_url() -> Iterator[str]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}/echo"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_aiohttp_client_survives_a_new_event_loop(echo_url: str) -> None:
+    pytest.importorskip("aiohttp")
+    client = _httpx_stub.AsyncClient(timeout=5)
+
+    async def post(value: int) -> dict:
+        response = await client.post(echo_url, json={"value": value})
+        assert response.status_code == 200
+        return response.json()
+
+    # Each asyncio.run() gets a fresh loop; the cached session must follow it.
+    assert asyncio.run(post(1)) == {"echo": {"value": 1}}
+    assert asyncio.run(post(2)) == {"echo": {"value": 2}}
+    asyncio.run(client.aclose())
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+
+import pytest
+
+import ai_ticket.metrics as metrics
+
+
+@pytest.fixture
+def fallback_metrics(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Load a private copy of ``ai_ticket.metrics`` without prometheus_client."""
+
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name, *args: None if name == "prometheus_client" else find_spec(name, *args),
+    )
+    spec = importlib.util.spec_from_file_location("_fallback_metrics", metrics.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run_threads(count: int, target) -> None:
+    barrier = threading.Barrier(count)
+
+    def runner(index: int) -> None:
+        barrier.wait()
+        target(index)
+
+    threads = [threading.Thread(target=runner, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_fallback_counter_sums_increments_across_threads(fallback_metrics: ModuleType) -> None:
+    counter = fallback_metrics.Counter("requests", "Requests", ["route"])
+    child = counter.labels("/event")
+
+    _run_threads(8, lambda _: [child.inc() for _ in range(5000)])
+
+    assert child.value == 8 * 5000
+    assert 'requests{route="/event"} 40000.0' in fallback_metrics.generate_latest().decode()
+
+
+def test_fallback_gauge_set_does_not_race_with_inc(fallback_metrics: ModuleType) -> None:
+    gauge = fallback_metrics.Gauge("in_flight", "In-flight requests")
+    child = gauge.labels()
+    workers = 7
+    # Bumped before every set(); workers count the increments they start
+    # after seeing the current round.
+    round_started = [0]
+    tallies: list[tuple[int, int]] = [(0, 0)] * workers
+    finished = threading.Event()
+
+    def worker(index: int) -> None:
+        if index == workers:
+            while not finished.is_set():
+                round_started[0] += 1
+                child.set(0)
+            return
+        seen, tally = 0, 0
+        for _ in range(20000):
+            current = round_started[0]
+            if current != seen:
+                seen, tally = current, 0
+            tally += 1
+            child.inc()
+        tallies[index] = (seen, tally)
+
+    def run(index: int) -> None:
+        try:
+            worker(index)
+        finally:
+            if index == 0:
+                finished.set()
+
+    # Switch threads as often as possible to surface lost updates.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        _run_threads(workers + 1, run)
+    finally:
+        sys.setswitchinterval(interval)
+
+    # Only increments started after the final set() may survive it, plus at
+    # most one in-flight increment per worker.
+    last_round = round_started[0]
+    survivors = sum(tally for seen, tally in tallies if seen == last_round)
+    assert child.value <= survivors + workers
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
+import json
+import logging
+import os
+import signal
+import threading
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from types import MappingProxyType
+
 import anyio
 import pytest
-from collections.abc import AsyncIterator, Iterator
 
 import ai_ticket.server as server
+from ai_ticket._compat import _orjson_stub
 from ai_ticket.events.inference import CompletionResponse, ErrorResponse
 from ai_ticket.metrics import CONTENT_TYPE_LATEST
 from ai_ticket.observability.metrics import MetricsStore
@@ -30,13 +43,17 @@ async def client() -> AsyncIterator[AsyncClient]:
     finally:
         if lifespan_manager is not None:
             await lifespan_manager.__aexit__(None, None, None)
+            # Lifespan shutdown marks the process as draining; undo it so
+            # later tests start from a healthy server.
+            server._SHUTDOWN_FLAG[0] = 0
+            server.shutdown_event.clear()
+            server._async_shutdown = None
 
 
 @pytest.fixture(autouse=True)
 def reset_auth_tokens() -> Iterator[None]:
-    original_tokens = server.TOKEN_MANAGER.tokens
     yield
-    server.TOKEN_MANAGER.update_tokens(original_tokens)
+    server.TOKEN_MANAGER.reload(force=True)
 
 
 async def test_handle_event_success(client: AsyncClient, mocker) -> None:
@@ -84,6 +101,91 @@ async def test_handle_event_not_json(client: AsyncClient, mocker) -> None:
     mock_on_event.assert_not_called()
 
 
+async def test_handle_event_malformed_json(client: AsyncClient, mocker) -> None:
+    mock_on_event = mocker.patch("ai_ticket.server.on_event")
+
+    response = await client.post(
+        "/event",
+        content=b'{"content": ',
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["error"] == "invalid_request"
+    mock_on_event.assert_not_called()
+
+
+async def test_handle_event_rejects_oversized_body(
+    client: AsyncClient, mocker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    on_event = mocker.patch("ai_ticket.server.on_event")
+    monkeypatch.setattr(server, "MAX_BODY_BYTES", 32)
+
+    response = await client.post("/event", json={"content": {"prompt": "x" * 64}})
+
+    assert response.status_code == 413
+    assert response.json()["error"] == "payload_too_large"
+    on_event.assert_not_called()
+
+
+async def test_handle_event_stops_reading_oversized_chunked_body(
+    client: AsyncClient, mocker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    on_event = mocker.patch("ai_ticket.server.on_event")
+    monkeypatch.setattr(server, "MAX_BODY_BYTES", 32)
+    sent: list[bytes] = []
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for _ in range(1000):
+            sent.append(b"x" * 16)
+            yield sent[-1]
+
+    # An async iterable body goes out chunked, without a Content-Length.
+    response = await client.post("/event", content=chunks(), headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 413
+    assert response.json()["error"] == "payload_too_large"
+    assert len(sent) < 1000
+    on_event.assert_not_called()
+
+
+@pytest.mark.parametrize("padding", ["", "x" * 2048])
+async def test_streaming_validation_error_is_single_sse_frame(client: AsyncClient, padding: str) -> None:
+    # The padded body exceeds the inline threshold and validates in a worker thread.
+    response = await client.post("/event", json={"stream": True, "padding": padding})
+
+    assert response.status_code == 400
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.content.startswith(b"data: ")
+    assert response.content.endswith(b"\n\n")
+    assert response.content.count(b"data: ") == 1
+
+
+async def test_handle_event_serialises_legacy_dataclass_results(client: AsyncClient, mocker) -> None:
+    @dataclass
+    class LegacyResult:
+        completion: str
+        status_code: int = 202
+
+    mocker.patch("ai_ticket.server.on_event").return_value = LegacyResult(completion="legacy")
+
+    response = await client.post("/event", json={"content": {"prompt": "hi"}})
+
+    assert response.status_code == 202
+    assert response.json() == {"completion": "legacy"}
+
+
+async def test_normalise_response_caches_coercion_per_type() -> None:
+    payload = {"completion": "as-is"}
+
+    assert server._normalise_response(payload) is payload
+    assert server._normalise_response(MappingProxyType({"a": 1})) == {"a": 1}
+    assert server._normalise_response(OrderedDict(b=2)) == {"b": 2}
+    assert server._normalise_response("text") == {"result": "text"}
+    assert server._NORMALISERS[MappingProxyType] is dict
+    assert server._NORMALISERS[str] is server._wrap_result
+
+
 async def test_handle_event_on_event_error(client: AsyncClient, mocker) -> None:
     mock_on_event = mocker.patch("ai_ticket.server.on_event")
     mock_on_event.return_value = ErrorResponse(
@@ -161,6 +263,32 @@ async def test_valid_bearer_token_allows_request(client: AsyncClient, mocker) ->
     assert response.json()["completion"] == "secure"
 
 
+async def test_credentials_follow_token_rotation(client: AsyncClient, mocker) -> None:
+    mocker.patch("ai_ticket.server.on_event").return_value = CompletionResponse(completion="secure")
+    server.TOKEN_MANAGER.update_tokens({"secret-token"})
+    headers = {"Authorization": "Bearer secret-token"}
+    payload = {"content": {"prompt": "authorised"}}
+
+    assert (await client.post("/event", json=payload, headers=headers)).status_code == 200
+    assert (await client.post("/event", json=payload, headers=headers)).status_code == 200
+
+    server.TOKEN_MANAGER.update_tokens({"rotated-token"})
+    assert (await client.post("/event", json=payload, headers=headers)).status_code == 403
+
+
+async def test_api_key_header_allows_request(client: AsyncClient, mocker) -> None:
+    mocker.patch("ai_ticket.server.on_event").return_value = CompletionResponse(completion="secure")
+    server.TOKEN_MANAGER.update_tokens({"secret-token"})
+
+    response = await client.post(
+        "/event",
+        json={"content": {"prompt": "authorised"}},
+        headers={"X-API-Key": "secret-token"},
+    )
+
+    assert response.status_code == 200
+
+
 async def test_metrics_endpoint_available(client: AsyncClient) -> None:
     response = await client.get("/metrics")
 
@@ -168,6 +296,217 @@ async def test_metrics_endpoint_available(client: AsyncClient) -> None:
     assert response.headers["content-type"] == CONTENT_TYPE_LATEST
 
 
+async def test_metrics_expose_sampled_worker_rss(client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    if server.resource is None:
+        pytest.skip("resource module unavailable")
+    monkeypatch.setattr(server, "_REQUEST_SEQUENCE", itertools.count())
+
+    await client.get("/health")
+    response = await client.get("/metrics")
+
+    assert f'ai_ticket_worker_max_rss_bytes{{pid="{os.getpid()}"}}' in response.text
+
+
+async def test_json_responses_are_compressed_but_streams_are_not(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if server.GZipMiddleware.__module__.startswith("ai_ticket._compat"):
+        pytest.skip("the fallback server does not compress responses")
+    fresh_store = MetricsStore()
+    for _ in range(5):
+        fresh_store.record_event(latency_s=0.01, success=False, error_code="backend_error", message="offline")
+    monkeypatch.setattr(server, "metrics_store", fresh_store)
+
+    summary = await client.get("/api/metrics/summary", headers={"Accept-Encoding": "gzip"})
+    assert summary.headers.get("content-encoding") == "gzip"
+    assert "totals" in summary.json()
+
+    response = await client.post(
+        "/event", json={"stream": True, "padding": "x" * 1024}, headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert "content-encoding" not in response.headers
+
+
+async def test_metrics_label_requests_by_route_template(client: AsyncClient, mocker) -> None:
+    record = mocker.patch("ai_ticket.server._record_request_metrics")
+
+    await client.get("/dashboard/assets/app-1234.js")
+    await client.get("/health")
+
+    endpoints = [call.args[1] for call in record.call_args_list]
+    assert endpoints == ["/dashboard/{asset_path}", "/health"]
+
+
+async def test_metrics_middleware_records_at_response_start(mocker) -> None:
+    record = mocker.patch("ai_ticket.server._record_request_metrics")
+    sent: list[dict] = []
+
+    async def app(scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": 201, "headers": [(b"content-type", b"text/plain")]})
+        assert record.call_count == 1
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "path": "/custom"}
+    await server.MetricsMiddleware(app)(scope, None, send)
+
+    assert record.call_args.args[:3] == ("POST", "unmatched", 201)
+    assert (b"x-request-processed-by", b"ai-ticket") in sent[0]["headers"]
+    assert sent[1]["body"] == b"ok"
+
+
+async def test_latency_observations_are_applied_off_the_request_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    observed: list[float] = []
+    monkeypatch.setattr(server, "_LATENCY_QUEUE", deque())
+    monkeypatch.setattr(server, "_latency_drainer", threading.current_thread())  # no background drain
+    monkeypatch.setattr(server, "_request_bindings", lambda *_: (None, None, observed.append))
+
+    server._record_request_metrics("GET", "/api/metrics/summary", 200, 0.25)
+    assert observed == []
+
+    chunks = [chunk async for chunk in server._metrics_exposition()]
+    assert chunks
+    assert observed == [0.25]
+    assert not server._LATENCY_QUEUE
+
+
+def test_latency_observations_apply_inline_when_the_queue_is_full(monkeypatch: pytest.MonkeyPatch) -> None:
+    observed: list[float] = []
+    monkeypatch.setattr(server, "_LATENCY_QUEUE", deque())
+    monkeypatch.setattr(server, "_LATENCY_QUEUE_LIMIT", 2)
+    monkeypatch.setattr(server, "_latency_drainer", threading.current_thread())  # no background drain
+    monkeypatch.setattr(server, "_request_bindings", lambda *_: (None, None, observed.append))
+
+    for duration in (0.1, 0.2, 0.3, 0.4):
+        server._record_request_metrics("GET", "/api/metrics/summary", 200, duration)
+
+    assert observed == [0.3, 0.4]
+    server._drain_latency_queue()
+    assert sorted(observed) == [0.1, 0.2, 0.3, 0.4]
+
+
+async def test_metrics_middleware_counts_unhandled_errors_as_500(mocker) -> None:
+    record = mocker.patch("ai_ticket.server._record_request_metrics")
+
+    async def app(scope, receive, send) -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await server.MetricsMiddleware(app)({"type": "http", "method": "GET", "path": "/x"}, None, None)
+
+    assert record.call_args.args[:3] == ("GET", "unmatched", 500)
+
+
+async def test_dashboard_serves_indexed_assets(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "app.js").write_text("console.log('hi')")
+    (tmp_path / "index.html").write_text("<html></html>")
+    monkeypatch.setattr(server, "UI_DIST_PATH", tmp_path)
+    monkeypatch.setattr(server, "_ui_asset_index", None)
+
+    asset = await client.get("/dashboard/assets/app.js")
+    assert asset.status_code == 200
+    assert asset.headers["cache-control"] == "public, max-age=3600"
+
+    fallback = await client.get("/dashboard/history")
+    assert fallback.text == "<html></html>"
+    assert fallback.headers["cache-control"] == "no-cache"
+
+
+async def test_dashboard_picks_up_rebuilt_assets(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (assets / "app.js").write_text("console.log('v1')")
+    (tmp_path / "index.html").write_text("<html></html>")
+    monkeypatch.setattr(server, "UI_DIST_PATH", tmp_path)
+    monkeypatch.setattr(server, "_ui_asset_index", None)
+    assert (await client.get("/dashboard/assets/app.js")).text == "console.log('v1')"
+
+    # Rewriting files inside assets/ leaves the dist root's mtime untouched.
+    root_mtime = tmp_path.stat().st_mtime_ns
+    (assets / "app.js").write_text("console.log('v2')")
+    (assets / "chunk.js").write_text("export {}")
+    os.utime(assets / "app.js", ns=(root_mtime + 10**9, root_mtime + 10**9))
+    os.utime(tmp_path, ns=(root_mtime, root_mtime))
+
+    assert (await client.get("/dashboard/assets/app.js")).text == "console.log('v2')"
+    assert (await client.get("/dashboard/assets/chunk.js")).text == "export {}"
+
+
+async def test_dashboard_revalidates_cached_assets_by_etag(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    (tmp_path / "index.html").write_text("<html></html>")
+    monkeypatch.setattr(server, "UI_DIST_PATH", tmp_path)
+    monkeypatch.setattr(server, "_ui_asset_index", None)
+
+    first = await client.get("/dashboard")
+    etag = first.headers["etag"]
+    assert first.headers["content-type"].startswith("text/html")
+
+    revalidated = await client.get("/dashboard", headers={"If-None-Match": f'W/"other", {etag}'})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    stale = await client.get("/dashboard", headers={"If-None-Match": '"other"'})
+    assert stale.status_code == 200
+
+
+async def test_dashboard_etag_changes_when_asset_is_overwritten(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    asset = assets / "app.js"
+    asset.write_text("console.log('v1')")
+    monkeypatch.setattr(server, "UI_DIST_PATH", tmp_path)
+    monkeypatch.setattr(server, "_ui_asset_index", None)
+
+    first = await client.get("/dashboard/assets/app.js")
+    etag = first.headers["etag"]
+    assert (await client.get("/dashboard/assets/app.js", headers={"If-None-Match": etag})).status_code == 304
+
+    mtime_ns = asset.stat().st_mtime_ns + 10**9
+    asset.write_text("console.log('v2')")
+    os.utime(asset, ns=(mtime_ns, mtime_ns))
+
+    changed = await client.get("/dashboard/assets/app.js", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.text == "console.log('v2')"
+    assert changed.headers["etag"] != etag
+
+
+async def test_security_middleware_is_bypassed_without_auth_or_rate_limits(
+    client: AsyncClient, mocker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mocker.patch("ai_ticket.server.on_event").return_value = CompletionResponse(completion="ok")
+    dispatched: list[str] = []
+    original_call = server.BaseHTTPMiddleware.__call__
+
+    async def counting_call(self, scope, receive, send):
+        dispatched.append(scope["path"])
+        await original_call(self, scope, receive, send)
+
+    monkeypatch.setattr(server.BaseHTTPMiddleware, "__call__", counting_call)
+    monkeypatch.setattr(server, "RATE_LIMITER", None)
+    payload = {"content": {"prompt": "open"}}
+
+    assert (await client.post("/event", json=payload)).status_code == 200
+    assert dispatched == []
+
+    server.TOKEN_MANAGER.update_tokens({"secret-token"})
+    assert (await client.post("/event", json=payload)).status_code == 401
+    assert dispatched == ["/event"]
+
+
 @pytest.mark.failure_mode
 async def test_rate_limiter_blocks_when_threshold_exceeded(client: AsyncClient, mocker) -> None:
     mocker.patch("ai_ticket.server.on_event").return_value = CompletionResponse(completion="ok")
@@ -203,15 +542,118 @@ async def test_metrics_stream_emits_updates(monkeypatch: pytest.MonkeyPatch) ->
 
     stream = server._metrics_event_stream()
     first_chunk = await stream.__anext__()
-    assert first_chunk.startswith("data: ")
+    assert first_chunk.startswith(b"data: ")
     assert len(fresh_store._subscribers) == 1
 
     fresh_store.record_event(latency_s=0.05, success=True)
     second_chunk = await stream.__anext__()
-    assert '"successes": 1' in second_chunk
+    assert b'"successes":1' in second_chunk
 
     await stream.aclose()
 
+
+async def test_metrics_stream_coalesces_backlogged_snapshots(monkeypatch: pytest.MonkeyPatch) -> None:
+    fresh_store = MetricsStore()
+    monkeypatch.setattr(server, "metrics_store", fresh_store)
+
+    stream = server._metrics_event_stream()
+    await stream.__anext__()
+    (queue,) = fresh_store._subscribers
+    for successes in (1, 2, 3):
+        queue.put_nowait({"totals": {"successes": successes}})
+
+    chunk = await stream.__anext__()
+    assert chunk == b'data: {"totals":{"successes":3}}\n\n'
+    assert queue.empty()
+
+    await stream.aclose()
+
+
+async def test_metrics_stream_receives_events_from_worker_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    fresh_store = MetricsStore()
+    monkeypatch.setattr(server, "metrics_store", fresh_store)
+
+    stream = server._metrics_event_stream()
+    await stream.__anext__()
+
+    await anyio.to_thread.run_sync(lambda: fresh_store.record_event(latency_s=0.01, success=True))
+    with anyio.fail_after(1):
+        chunk = await stream.__anext__()
+    assert b'"successes":1' in chunk
+
+    await stream.aclose()
+    assert not fresh_store._subscribers
+
+
+async def test_metrics_stream_ends_on_shutdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(server, "metrics_store", MetricsStore())
+    monkeypatch.setattr(server, "_SHUTDOWN_FLAG", array("b", [0]))
+    monkeypatch.setattr(server, "shutdown_event", threading.Event())
+    monkeypatch.setattr(server, "_async_shutdown", None)
+
+    stream = server._metrics_event_stream()
+    await stream.__anext__()
+
+    await anyio.to_thread.run_sync(server._mark_shutdown)
+    with anyio.fail_after(1):
+        final = await stream.__anext__()
+    assert final == b'data: {"done":true,"reason":"shutdown"}\n\n'
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+
+
+async def test_metrics_stream_ends_on_uvicorn_exit_signal(monkeypatch: pytest.MonkeyPatch) -> None:
+    uvicorn = pytest.importorskip("uvicorn")
+
+    monkeypatch.setattr(server, "metrics_store", MetricsStore())
+    monkeypatch.setattr(server, "_SHUTDOWN_FLAG", array("b", [0]))
+    monkeypatch.setattr(server, "shutdown_event", threading.Event())
+    monkeypatch.setattr(server, "_async_shutdown", None)
+
+    config = uvicorn.Config(server.app, host="127.0.0.1", port=0, log_level="error", lifespan="on")
+    uvicorn_server = uvicorn.Server(config)
+    # Uvicorn swaps its own handlers in for the serve; the startup hook must
+    # chain onto them rather than the ones installed at import.
+    previous = {signum: signal.getsignal(signum) for signum in (signal.SIGTERM, signal.SIGINT)}
+    serving = asyncio.ensure_future(uvicorn_server.serve())
+    try:
+        with anyio.fail_after(5):
+            while not uvicorn_server.started:
+                await anyio.sleep(0.01)
+        port = uvicorn_server.servers[0].sockets[0].getsockname()[1]
+
+        async with AsyncClient(base_url=f"http://127.0.0.1:{port}") as network_client:
+            async with network_client.stream("GET", "/api/metrics/stream") as response:
+                frames = response.aiter_raw()
+                with anyio.fail_after(5):
+                    assert (await frames.__anext__()).startswith(b"data: ")
+                    os.kill(os.getpid(), signal.SIGTERM)
+                    remaining = b"".join([chunk async for chunk in frames])
+        assert remaining.endswith(b'data: {"done":true,"reason":"shutdown"}\n\n')
+        with anyio.fail_after(5):
+            await serving
+    finally:
+        serving.cancel()
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+
+async def test_metrics_stream_cancels_pending_read_on_disconnect(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(server, "metrics_store", MetricsStore())
+    stream = server._metrics_event_stream()
+    await stream.__anext__()
+
+    reader = asyncio.ensure_future(stream.__anext__())
+    await anyio.sleep(0.01)
+    reader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await reader
+    await anyio.sleep(0)
+
+    pending = [task for task in asyncio.all_tasks() if "Queue.get" in repr(task.get_coro())]
+    assert not pending
+
+
 @pytest.mark.failure_mode
 async def test_metrics_stream_reconnects_after_client_drop(monkeypatch: pytest.MonkeyPatch) -> None:
     fresh_store = MetricsStore()
@@ -243,8 +685,65 @@ async def test_metrics_stream_reconnects_after_client_drop(monkeypatch: pytest.M
         message="burst",
     )
     follow_up = await second_stream.__anext__()
-    assert '"rate_limited"' in follow_up
+    assert b'"rate_limited"' in follow_up
 
     await second_stream.aclose()
 
     assert await _wait_for_unsubscribe()
+
+
+def test_orjson_response_renders_dataclasses_compactly() -> None:
+    payload = {"result": CompletionResponse(completion="done"), 1: "one"}
+    expected = b'{"result":{"completion":"done"},"1":"one"}'
+
+    assert server.ORJSONResponse(payload).body == expected
+    assert _orjson_stub.dumps(payload, option=_orjson_stub.OPT_NON_STR_KEYS) == expected
+
+
+def test_json_formatter_matches_stdlib_timestamps() -> None:
+    record = logging.LogRecord("ai_ticket", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+    record.keys = ["content"]
+
+    structured = json.loads(server.JsonFormatter().format(record))
+
+    assert structured["message"] == "hello world"
+    assert structured["extra"] == {"keys": ["content"]}
+    assert structured["time"] == logging.Formatter().formatTime(record)
+
+
+def test_json_formatter_reuses_escaped_prefix() -> None:
+    formatter = server.JsonFormatter()
+    name = 'ai_ticket."quoted"'
+    first = logging.LogRecord(name, logging.WARNING, __file__, 1, "one", (), None)
+    second = logging.LogRecord(name, logging.WARNING, __file__, 1, "two", (), None)
+
+    assert json.loads(formatter.format(first))["logger"] == name
+    structured = json.loads(formatter.format(second))
+
+    assert structured["level"] == "WARNING"
+    assert structured["message"] == "two"
+    assert (name, "WARNING") in server.JsonFormatter._prefix_cache
+
+
+async def test_health_reports_shutdown_flag(client: AsyncClient, monkeypatch) -> None:
+    response = await client.get("/health")
+    assert response.json() == {"status": "healthy", "shutdown_initiated": False}
+
+    monkeypatch.setattr(server, "_SHUTDOWN_FLAG", array("b", [1]))
+    response = await client.get("/health")
+    assert response.json()["shutdown_initiated"] is True
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("Bearer abc", "abc"),
+        ("bearer  abc ", "abc"),
+        ("BEARER abc", "abc"),
+        ("Bearer ", None),
+        ("Basic abc", None),
+        ("Bearer", None),
+    ],
+)
+async def test_extract_bearer_token_variants(header: str, expected: str | None) -> None:
+    assert server._extract_bearer_token({"authorization": header}) == expected
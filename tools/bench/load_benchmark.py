@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Lightweight load benchmark for the Flask inference server."""
+"""Lightweight load benchmark for the inference server."""
 
 from __future__ import annotations
 
@@ -31,7 +31,7 @@ def _build_event_payloads(total: int) -> Iterable[dict[str, object]]:
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Benchmark the /event endpoint with concurrent requests.")
-    parser.add_argument("--base-url", default="http://127.0.0.1:5000", help="Base URL for the running Flask server.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:5000", help="Base URL for the running server.")
     parser.add_argument("--requests", type=int, default=50, help="Total number of requests to issue.")
     parser.add_argument("--concurrency", type=int, default=10, help="Maximum in-flight requests.")
     parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds.")